@@ -84,6 +84,24 @@ os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
 # Store job status
 jobs = {}
 
+# Translators are created on first use and shared by every job in the process, so their
+# connection pools (warmed once at creation) are reused instead of rebuilt per request.
+# Each translation job writes its output to a blob named for that job, so concurrent jobs
+# on the same upload (e.g. one file into two languages) can share them
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(client_class):
+    """Return the process-wide instance of a translator class, creating it on first use."""
+    with _shared_clients_lock:
+        client = _shared_clients.get(client_class)
+        if client is None:
+            logger.debug(f"Initializing shared {client_class.__name__}")
+            client = client_class(use_managed_identity=USE_MANAGED_IDENTITY)
+            _shared_clients[client_class] = client
+        return client
+
 
 def sanitize_container_name(name):
     """
@@ -172,35 +190,27 @@ def run_single_translation(job_id, file_path, target_language, source_language=N
     job = jobs[job_id]
     try:
         job.update(status="running", progress=10, message="Initializing translator...")
-        logger.debug(f"Job {job_id}: Initializing SingleDocumentTranslator")
-        translator = SingleDocumentTranslator(use_managed_identity=USE_MANAGED_IDENTITY)
+        translator = get_shared_client(SingleDocumentTranslator)
         
-        job.update(progress=30, message="Uploading document to Azure...")
+        job.update(progress=30, message="Translating document...")
         logger.info(f"Job {job_id}: Starting translation")
-        translation_result = translator.translate_document(
+        output_filename = f"translated_{target_language}_{os.path.basename(file_path)}"
+        output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
+        # Small documents are translated in a single request; larger ones are uploaded,
+        # translated as a batch job and downloaded to output_path
+        translation_result = translator.translate_document_to_file(
             input_file_path=file_path,
             target_language=target_language,
+            output_path=output_path,
             source_language=source_language
         )
         
         if translation_result:
-            job.update(progress=80, message="Downloading translated document...")
-            logger.info(f"Job {job_id}: Translation successful, downloading result")
-            output_filename = f"translated_{target_language}_{os.path.basename(file_path)}"
-            output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
-            
-            # Handle both old string format and new dict format
-            if isinstance(translation_result, dict):
-                translated_url = translation_result['url']
-                detected_lang = translation_result.get('detected_source_language', 'unknown')
-            else:
-                translated_url = translation_result
-                detected_lang = 'unknown'
+            detected_lang = translation_result.get('detected_source_language', 'unknown')
             
             # Log detected language prominently
             logger.info(f"Job {job_id}: ✓ Source language detected: {detected_lang}")
             logger.info(f"Job {job_id}: → Target language: {target_language}")
-            translator.download_translated_document(translated_url, output_path)
             
             logger.info(f"Job {job_id}: Completed successfully - Output: {output_filename}")
             job.update(
@@ -313,7 +323,7 @@ def run_ocr_translation(job_id, file_path, target_language, source_language=None
     job = jobs[job_id]
     try:
         job.update(status="running", progress=10, message="Initializing OCR pipeline...")
-        pipeline = OCRTranslationPipeline(use_managed_identity=USE_MANAGED_IDENTITY)
+        pipeline = get_shared_client(OCRTranslationPipeline)
         
         output_folder = os.path.join(app.config['OUTPUT_FOLDER'], f"ocr_{job_id}")
         os.makedirs(output_folder, exist_ok=True)
@@ -5,16 +5,19 @@ Supports: PDF, Office (Word/Excel/PowerPoint), OpenDocument, Text, HTML, Markdow
 """
 
 import os
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from azure.ai.translation.document import DocumentTranslationClient, DocumentTranslationInput, TranslationTarget
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ResourceExistsError
 from azure.storage.blob import BlobServiceClient, generate_blob_sas, generate_container_sas, BlobSasPermissions, ContainerSasPermissions, ContainerClient
 from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from pathlib import Path
 
+from blob_utils import build_requests_transport, document_name, open_for_upload
+
 # Load environment variables
 load_dotenv()
 
@@ -42,6 +45,19 @@ if log_level == logging.DEBUG:
 else:
     logger.info(f"Logging level: {log_level_str}")
 
+# Number of documents uploaded in parallel, and per-blob block concurrency for large files
+UPLOAD_PARALLEL = int(os.getenv("UPLOAD_PARALLEL", "16"))
+UPLOAD_BLOCK_CONCURRENCY = 8
+# Per-blob ranged-read concurrency when downloading translated documents
+DOWNLOAD_BLOCK_CONCURRENCY = 8
+# Every parallel upload can have UPLOAD_BLOCK_CONCURRENCY block requests in flight at once
+TRANSPORT_POOL_SIZE = max(UPLOAD_PARALLEL * UPLOAD_BLOCK_CONCURRENCY, DOWNLOAD_BLOCK_CONCURRENCY)
+# The SDK polls job status every POLL_INITIAL_INTERVAL seconds; progress is reported after
+# 2 seconds, then 1.5x less often each time, up to every 30 seconds
+POLL_INITIAL_INTERVAL = 2
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_INTERVAL = 30
+
 
 class BatchDocumentTranslator:
     def __init__(self, use_managed_identity=None):
@@ -74,26 +90,63 @@ class BatchDocumentTranslator:
         )
         
         # Initialize blob service client based on authentication method
-        account_url = f"https://{self.storage_account_name}.blob.core.windows.net"
+        self._account_url = f"https://{self.storage_account_name}.blob.core.windows.net"
         
         if self.use_managed_identity:
             # Use Managed Identity (for Azure-hosted environments)
             credential = DefaultAzureCredential()
             self.blob_service_client = BlobServiceClient(
-                account_url=account_url,
-                credential=credential
+                account_url=self._account_url,
+                credential=credential,
+                transport=build_requests_transport(TRANSPORT_POOL_SIZE)
             )
         else:
             # Use connection string or account key (for local development)
             if self.storage_connection_string:
                 self.blob_service_client = BlobServiceClient.from_connection_string(
-                    self.storage_connection_string
+                    self.storage_connection_string,
+                    transport=build_requests_transport(TRANSPORT_POOL_SIZE)
                 )
             else:
                 self.blob_service_client = BlobServiceClient(
-                    account_url=account_url,
-                    credential=AzureKeyCredential(self.storage_account_key)
+                    account_url=self._account_url,
+                    credential=AzureKeyCredential(self.storage_account_key),
+                    transport=build_requests_transport(TRANSPORT_POOL_SIZE)
                 )
+        
+        # Containers created or found by this translator; later calls skip the create request
+        self._known_containers = set()
+    
+    def _ensure_container(self, container_name):
+        """
+        Create a blob container if it does not exist yet.
+        
+        Args:
+            container_name: Name of the blob container
+            
+        Returns:
+            True if the container was created, False if it already existed,
+            None if that could not be determined
+        """
+        if container_name in self._known_containers:
+            return False
+        
+        try:
+            # Create container without public access (SAS tokens will provide access)
+            self.blob_service_client.create_container(container_name)
+            print(f"Created container: {container_name}")
+            logger.info(f"Successfully created container: {container_name}")
+            created = True
+        except ResourceExistsError:
+            # Container already exists, which is fine
+            print(f"Container {container_name} already exists")
+            created = False
+        except Exception as e:
+            print(f"Container creation note: {e}")
+            return None
+        
+        self._known_containers.add(container_name)
+        return created
     
     def upload_documents_to_blob(self, file_paths, container_name):
         """
@@ -108,34 +161,35 @@ class BatchDocumentTranslator:
         """
         try:
             # Create container if it doesn't exist
+            self._ensure_container(container_name)
             container_client = self.blob_service_client.get_container_client(container_name)
-            try:
-                # Create container without public access (SAS tokens will provide access)
-                container_client.create_container()
-                print(f"Created container: {container_name}")
-            except Exception as e:
-                # Container might already exist, which is fine
-                if "ContainerAlreadyExists" in str(e) or "already exists" in str(e).lower():
-                    print(f"Container {container_name} already exists")
-                else:
-                    print(f"Container creation note: {e}")
-            
-            uploaded_urls = []
             
+            existing_paths = []
             for file_path in file_paths:
                 if not os.path.exists(file_path):
                     print(f"Warning: File not found: {file_path}")
                     continue
-                
+                existing_paths.append(file_path)
+            
+            def upload_one(file_path):
                 # Upload the file
                 blob_name = os.path.basename(file_path)
                 blob_client = container_client.get_blob_client(blob_name)
                 
-                with open(file_path, "rb") as data:
-                    blob_client.upload_blob(data, overwrite=True)
+                # Passing the length lets the SDK split the file into blocks without probing the stream
+                file_size = os.stat(file_path).st_size
+                with open_for_upload(file_path, file_size) as data:
+                    blob_client.upload_blob(data, overwrite=True, length=file_size, max_concurrency=UPLOAD_BLOCK_CONCURRENCY)
                     print(f"  Uploaded: {blob_name}")
                 
-                uploaded_urls.append(blob_client.url)
+                return blob_client.url
+            
+            # Upload files in parallel over the shared client's connection pool
+            uploaded_urls = []
+            if existing_paths:
+                max_workers = min(UPLOAD_PARALLEL, len(existing_paths))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    uploaded_urls = list(executor.map(upload_one, existing_paths))
             
             print(f"Uploaded {len(uploaded_urls)} documents to container {container_name}")
             return uploaded_urls
@@ -191,10 +245,13 @@ class BatchDocumentTranslator:
             print("\nUploading source documents...")
             self.upload_documents_to_blob(document_files, source_container)
             
+            # All SAS tokens for this job share one expiry
+            sas_expiry = datetime.now(timezone.utc) + timedelta(hours=24)
+            
             # Generate source container URL (with or without SAS token)
             if self.use_managed_identity:
                 # With Managed Identity, no SAS token needed - Translator uses system identity
-                source_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}"
+                source_container_url = f"{self._account_url}/{source_container}"
             else:
                 # Generate SAS token for source container using container-specific function
                 source_sas_token = generate_container_sas(
@@ -202,9 +259,9 @@ class BatchDocumentTranslator:
                     container_name=source_container,
                     account_key=self.storage_account_key,
                     permission=ContainerSasPermissions(read=True, list=True),
-                    expiry=datetime.utcnow() + timedelta(hours=24)
+                    expiry=sas_expiry
                 )
-                source_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}?{source_sas_token}"
+                source_container_url = f"{self._account_url}/{source_container}?{source_sas_token}"
             
             # Create translation targets for each language
             translation_targets = []
@@ -221,30 +278,21 @@ class BatchDocumentTranslator:
                     logger.error(error_msg)
                     raise ValueError(error_msg)
                 
-                # Create target container
-                target_container_client = self.blob_service_client.get_container_client(target_container_name)
-                try:
-                    # Create container without public access (SAS tokens will provide access)
-                    target_container_client.create_container()
-                    print(f"Created target container: {target_container_name}")
-                    logger.info(f"Successfully created container: {target_container_name}")
-                except Exception as e:
-                    # Container might already exist, which is fine
-                    if "ContainerAlreadyExists" in str(e) or "already exists" in str(e).lower():
-                        print(f"Target container {target_container_name} already exists")
-                        # Clear existing blobs to avoid TargetFileAlreadyExists error
-                        print(f"Clearing existing files from {target_container_name}...")
-                        blobs = target_container_client.list_blobs()
-                        for blob in blobs:
-                            target_container_client.delete_blob(blob.name)
-                            print(f"  Deleted: {blob.name}")
-                    else:
-                        print(f"Target container creation note: {e}")
+                # Create target container, or clear it if it already exists
+                if self._ensure_container(target_container_name) is False:
+                    # Clear existing blobs to avoid TargetFileAlreadyExists error
+                    print(f"Clearing existing files from {target_container_name}...")
+                    target_container_client = self.blob_service_client.get_container_client(target_container_name)
+                    blob_names = [blob.name for blob in target_container_client.list_blobs()]
+                    # Batch deletes (up to 256 blobs per request) instead of one DELETE per blob
+                    for start in range(0, len(blob_names), 256):
+                        target_container_client.delete_blobs(*blob_names[start:start + 256])
+                    print(f"  Deleted {len(blob_names)} file(s)")
                 
                 # Generate target container URL (with or without SAS token)
                 if self.use_managed_identity:
                     # With Managed Identity, no SAS token needed
-                    target_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container_name}"
+                    target_container_url = f"{self._account_url}/{target_container_name}"
                 else:
                     # Generate SAS token for target container using container-specific function
                     target_sas_token = generate_container_sas(
@@ -252,9 +300,9 @@ class BatchDocumentTranslator:
                         container_name=target_container_name,
                         account_key=self.storage_account_key,
                         permission=ContainerSasPermissions(write=True, read=True, list=True, create=True, add=True),
-                        expiry=datetime.utcnow() + timedelta(hours=24)
+                        expiry=sas_expiry
                     )
-                    target_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container_name}?{target_sas_token}"
+                    target_container_url = f"{self._account_url}/{target_container_name}?{target_sas_token}"
                 
                 translation_targets.append(
                     TranslationTarget(
@@ -291,15 +339,19 @@ class BatchDocumentTranslator:
             translation_input = DocumentTranslationInput(**translation_kwargs)
             
             # Start translation
-            poller = self.translation_client.begin_translation([translation_input])
+            poller = self.translation_client.begin_translation([translation_input], polling_interval=POLL_INITIAL_INTERVAL)
             
             print("Batch translation job submitted. Waiting for completion...")
             print("This may take several minutes depending on the number and size of documents.\n")
             
-            # Monitor progress
+            # Monitor progress, backing off so small batches finish within seconds
+            # while long-running ones are not polled needlessly often
+            poll_interval = POLL_INITIAL_INTERVAL
             while not poller.done():
-                time.sleep(30)
-                print("  Still processing...")
+                poller.wait(timeout=poll_interval)
+                if not poller.done():
+                    print("  Still processing...")
+                poll_interval = min(POLL_MAX_INTERVAL, poll_interval * POLL_BACKOFF_FACTOR)
             
             result = poller.result()
             
@@ -316,7 +368,7 @@ class BatchDocumentTranslator:
             for document in result:
                 if document.status == "Succeeded":
                     success_count += 1
-                    source_file = os.path.basename(document.source_document_url.split('?')[0])
+                    source_file = document_name(document.source_document_url)
                     target_lang = document.translated_to
                     
                     # Note: Azure Document Translation API does not expose detected source language
@@ -346,7 +398,7 @@ class BatchDocumentTranslator:
                     
                 elif document.status == "Failed":
                     failure_count += 1
-                    source_file = os.path.basename(document.source_document_url.split('?')[0])
+                    source_file = document_name(document.source_document_url)
                     target_lang = getattr(document, 'translated_to', 'unknown')
                     error_code = document.error.code if document.error else 'Unknown'
                     error_msg = document.error.message if document.error else 'Unknown error'
@@ -397,8 +449,9 @@ class BatchDocumentTranslator:
                 blob_client = container_client.get_blob_client(blob.name)
                 output_path = os.path.join(output_folder, blob.name)
                 
+                # Stream parallel ranged reads straight to disk instead of buffering the whole blob
                 with open(output_path, "wb") as download_file:
-                    download_file.write(blob_client.download_blob().readall())
+                    blob_client.download_blob(max_concurrency=DOWNLOAD_BLOCK_CONCURRENCY).readinto(download_file)
                 
                 print(f"  Downloaded: {blob.name}")
                 downloaded_count += 1
@@ -0,0 +1,113 @@
+"""
+Blob Storage helpers shared by the translation scripts.
+Recognizing and parsing blob URLs, opening files for upload, server-side copies
+and building pooled HTTP transports for the sync Azure clients.
+"""
+
+import os
+import mmap
+import time
+import logging
+import contextlib
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline.transport import RequestsTransport
+from urllib.parse import quote, unquote, urlparse
+
+# Files at least this large are uploaded from a memory map, so blocks are sliced straight
+# from the page cache instead of being copied through a buffered reader
+MMAP_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+
+# Seconds a server-side blob copy may stay pending before it is aborted
+BLOB_COPY_TIMEOUT = int(os.getenv("BLOB_COPY_TIMEOUT", "600"))
+
+logger = logging.getLogger(__name__)
+
+
+def is_blob_url(path_or_url):
+    """
+    Return True if an input document refers to a blob URL rather than a local file.
+    
+    Any http(s) URL is accepted, so storage emulators and custom domains work as well
+    as *.blob.core.windows.net.
+    """
+    return urlparse(path_or_url).scheme in ("http", "https")
+
+
+def parse_blob_url(blob_url):
+    """
+    Split a blob URL into (container_name, blob_name).
+    
+    Handles SAS query strings, virtual directories (container/dir/file.pdf)
+    and percent-encoded blob names.
+    """
+    path = urlparse(blob_url).path.lstrip('/')
+    container_name, _, blob_name = path.partition('/')
+    return container_name, unquote(blob_name)
+
+
+def blob_url_in_container(container_url, blob_name):
+    """Return the URL of a blob inside a container URL, keeping any SAS query string."""
+    base, sep, query = container_url.partition('?')
+    return f"{base.rstrip('/')}/{quote(blob_name)}{sep}{query}"
+
+
+def document_name(path_or_url):
+    """Return the file name of a local path or blob URL (without any SAS query string)."""
+    if is_blob_url(path_or_url):
+        return os.path.basename(unquote(urlparse(path_or_url).path))
+    return os.path.basename(path_or_url)
+
+
+@contextlib.contextmanager
+def open_for_upload(file_path, file_size):
+    """Open a local file for upload, memory-mapping it when it is large."""
+    with open(file_path, "rb") as f:
+        if file_size < MMAP_UPLOAD_THRESHOLD:
+            yield f
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+def build_requests_transport(pool_size=32):
+    """
+    Build a requests transport whose connection pool is large enough for parallel
+    transfers and concurrent documents (the requests default is 10 per host).
+    """
+    session = requests.Session()
+    # Retries are handled by the Azure SDK retry policy, not urllib3
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session, session_owner=True)
+
+
+def copy_blob_and_wait(blob_client, source_url, timeout=BLOB_COPY_TIMEOUT):
+    """
+    Copy a blob into blob_client server side and wait for the copy to finish.
+    
+    A copy still pending after timeout seconds is aborted, so a stalled copy never
+    blocks the caller (or keeps running against the destination blob) indefinitely.
+    
+    Raises:
+        TimeoutError: If the copy is still pending after timeout seconds
+        RuntimeError: If the copy fails or is aborted by the service
+    """
+    blob_client.start_copy_from_url(source_url)
+    
+    # Copies within a region are usually done at once; larger ones stay pending for a while
+    deadline = time.monotonic() + timeout
+    copy = blob_client.get_blob_properties().copy
+    while copy.status == "pending":
+        if time.monotonic() >= deadline:
+            try:
+                blob_client.abort_copy(copy.id)
+            except HttpResponseError as e:
+                logger.warning("Could not abort blob copy %s: %s", copy.id, e)
+            raise TimeoutError(f"Blob copy still pending after {timeout} seconds")
+        time.sleep(0.5)
+        copy = blob_client.get_blob_properties().copy
+    if copy.status != "success":
+        raise RuntimeError(f"Blob copy ended with status {copy.status}: {copy.status_description}")
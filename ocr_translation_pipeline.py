@@ -16,16 +16,52 @@ Supports 25+ file formats:
 """
 
 import os
+import gzip
+import asyncio
+import json
 import time
+import uuid
+import random
+import shutil
+import hashlib
+import inspect
 import logging
-from azure.ai.formrecognizer import DocumentAnalysisClient
-from azure.ai.translation.document import DocumentTranslationClient, DocumentTranslationInput, TranslationTarget
+import functools
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+# The Azure service SDKs (Document Intelligence, Translator, Storage, Identity) are
+# imported where they are used so that importing this module, e.g. from the web
+# app, doesn't pay their load time up front
 from azure.core.credentials import AzureKeyCredential
-from azure.storage.blob import BlobServiceClient, generate_blob_sas, generate_container_sas, BlobSasPermissions, ContainerSasPermissions
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
-from datetime import datetime, timedelta
+from azure.core.exceptions import HttpResponseError, ResourceExistsError, ResourceNotFoundError
+from azure.core.rest import HttpRequest
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from io import BytesIO
+from urllib.parse import urlparse
+
+from blob_utils import blob_url_in_container, build_requests_transport, copy_blob_and_wait, document_name, is_blob_url, parse_blob_url
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup for the OCR result cache; fall back to stdlib json
+    orjson = None
+
+try:
+    import pypdf
+except ImportError:
+    # pypdf is optional; without it every PDF goes through OCR
+    pypdf = None
+
+try:
+    import pikepdf
+    from reportlab.pdfgen import canvas as pdf_canvas
+except ImportError:
+    # pikepdf + reportlab are optional; without them PDFs are copied without a text layer
+    pikepdf = None
+    pdf_canvas = None
 
 # Load environment variables
 load_dotenv()
@@ -52,16 +88,178 @@ azure_logger.setLevel(log_level)
 if log_level == logging.DEBUG:
     logger.info("API call logging enabled - HTTP requests, headers, and responses will be logged")
 else:
-    logger.info(f"Logging level: {log_level_str}")
+    # Keep the rest of the Azure SDK (identity, polling, etc.) quiet outside DEBUG
+    logging.getLogger('azure').setLevel(logging.WARNING)
+    logger.info("Logging level: %s", log_level_str)
+
+# Worker threads for the blocking file and blob work done on behalf of the async
+# methods. Sized to match the blob transport's connection pool so concurrent
+# documents don't queue on asyncio's small default executor
+_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("PIPELINE_WORKERS", "32")), thread_name_prefix="ocr-pipeline")
+
+# Parallel block transfers per blob upload/download; data is streamed in chunks
+# so memory use stays near the SDK's block size instead of the file size
+BLOB_TRANSFER_CONCURRENCY = 8
+
+# Most recently used BlobClients kept per pipeline; older ones are evicted
+BLOB_CLIENT_CACHE_SIZE = 256
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking call on the shared pipeline executor without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+def _copy_file(src, dst):
+    """
+    Copy a file's data and metadata, keeping the bytes in the kernel where possible.
+
+    Uses os.copy_file_range (Linux, reflink-aware) and falls back to shutil.copyfile,
+    which itself uses sendfile/fcopyfile on platforms that support it.
+    """
+    size = os.path.getsize(src)
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            copied = 0
+            while copied < size:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                if n == 0:
+                    break
+                copied += n
+        if copied != size:
+            raise OSError("copy_file_range copied fewer bytes than expected")
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _read_file(path):
+    """Read a whole file into memory."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _dump_json_gz(data, path):
+    """Serialize data as gzip-compressed JSON, replacing path atomically."""
+    payload = orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+    # Unique per writer, so concurrent runs on identical input never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with gzip.open(tmp_path, "wb", compresslevel=1) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _load_json_gz(path):
+    """Load gzip-compressed JSON written by _dump_json_gz."""
+    with gzip.open(path, "rb") as f:
+        payload = f.read()
+    return orjson.loads(payload) if orjson else json.loads(payload)
+
+
+def _is_throttle_error(error):
+    """Return True if an Azure error is throttling or a transient overload."""
+    if not isinstance(error, HttpResponseError):
+        return False
+    if error.status_code in (429, 503):
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "quota" in message
+
+
+def retry_on_throttle(max_attempts=3, base=1.0, cap=32.0):
+    """
+    Retry a sync or async function when Azure throttles the request.
+    
+    Delays double after each attempt (base, 2*base, ...) up to cap, with a
+    little random jitter so concurrent callers don't retry in lockstep.
+    
+    Args:
+        max_attempts: Total number of attempts before the error is raised
+        base: Delay in seconds before the first retry
+        cap: Maximum delay in seconds between attempts
+    """
+    def delay(attempt):
+        return min(cap, base * 2 ** attempt) + random.uniform(0, 0.5)
+    
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except HttpResponseError as e:
+                        if attempt == max_attempts - 1 or not _is_throttle_error(e):
+                            raise
+                        wait = delay(attempt)
+                        logger.warning("%s throttled, retrying in %.1fs (attempt %d/%d)", func.__name__, wait, attempt + 1, max_attempts)
+                        await asyncio.sleep(wait)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except HttpResponseError as e:
+                    if attempt == max_attempts - 1 or not _is_throttle_error(e):
+                        raise
+                    wait = delay(attempt)
+                    logger.warning("%s throttled, retrying in %.1fs (attempt %d/%d)", func.__name__, wait, attempt + 1, max_attempts)
+                    time.sleep(wait)
+        return wrapper
+    
+    return decorator
+
+
+class RateLimiter:
+    """
+    Async limiter that spaces out requests to stay under a service's
+    requests-per-second ceiling.
+    
+    Args:
+        rps: Maximum requests per second
+    """
+    
+    def __init__(self, rps):
+        self.min_interval = 1.0 / rps
+        self.last_ts = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until the next request is allowed to go out."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self.last_ts + self.min_interval - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now += wait
+            self.last_ts = now
 
 
 class OCRTranslationPipeline:
-    def __init__(self, use_managed_identity=None):
+    # Blob service clients shared by all pipeline instances, keyed by account and auth
+    # method, so each keeps one warm connection pool for the life of the process
+    _blob_service_clients = {}
+    _blob_service_clients_lock = threading.Lock()
+    
+    # (account, container) pairs known to exist, so containers aren't re-created per document
+    _known_containers = set()
+    
+    def __init__(self, use_managed_identity=None, warm_connections=True):
         """Initialize the OCR and translation pipeline with Azure credentials.
         
         Args:
             use_managed_identity: If True, use Managed Identity. If False, use keys.
                                  If None, auto-detect based on whether connection string is present.
+            warm_connections: If True, open connections to each service in a background thread
+                              so the first real request doesn't pay DNS/TLS setup.
         """
         # Document Intelligence credentials
         self.doc_intel_endpoint = os.getenv("AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
@@ -82,6 +280,19 @@ class OCRTranslationPipeline:
         
         self.use_managed_identity = use_managed_identity
         
+        # Blob clients keyed by (container, blob), reusing the service client's HTTP pipeline;
+        # bounded LRU so a long-running pipeline doesn't keep one client per document forever
+        self._blob_clients = OrderedDict()
+        self._blob_clients_lock = threading.Lock()
+        
+        # SAS tokens keyed by (container, blob, permission) -> (token, expiry)
+        self._sas_cache = {}
+        
+        # Optional on-disk cache of OCR results (disabled unless OCR_CACHE_DIR is set)
+        self.ocr_cache_dir = os.getenv("OCR_CACHE_DIR")
+        if self.ocr_cache_dir:
+            os.makedirs(self.ocr_cache_dir, exist_ok=True)
+        
         # Validate required credentials
         if not all([
             self.doc_intel_endpoint, self.doc_intel_key,
@@ -90,72 +301,336 @@ class OCRTranslationPipeline:
         ]):
             raise ValueError("Missing required Azure credentials. Please check your .env file.")
         
+        # Seconds between LRO status polls when the service sends no Retry-After header.
+        # Both SDKs default to 1s; short OCR jobs often finish in under a second, so
+        # polling them twice as often saves up to half a second each
+        ocr_polling_interval = float(os.getenv("OCR_POLLING_INTERVAL", "0.5"))
+        translation_polling_interval = float(os.getenv("TRANSLATION_POLLING_INTERVAL", "1"))
+        
         # Initialize clients
+        from azure.ai.formrecognizer import DocumentAnalysisClient
+        from azure.ai.formrecognizer.aio import DocumentAnalysisClient as AsyncDocumentAnalysisClient
+        from azure.ai.translation.document import DocumentTranslationClient
+        from azure.ai.translation.document.aio import DocumentTranslationClient as AsyncDocumentTranslationClient
+        
         self.doc_analysis_client = DocumentAnalysisClient(
             endpoint=self.doc_intel_endpoint,
-            credential=AzureKeyCredential(self.doc_intel_key)
+            credential=AzureKeyCredential(self.doc_intel_key),
+            polling_interval=ocr_polling_interval
         )
         
         self.translation_client = DocumentTranslationClient(
             self.translator_endpoint,
-            AzureKeyCredential(self.translator_key)
+            AzureKeyCredential(self.translator_key),
+            polling_interval=translation_polling_interval
         )
         
-        # Initialize blob service client based on authentication method
+        # Caps on in-flight jobs and request rate for the async methods. Document
+        # Intelligence and Translator have different TPS limits, so each gets its own
+        self._ocr_sem = asyncio.Semaphore(int(os.getenv("OCR_MAX_CONCURRENCY", "14")))
+        self._ocr_rate_limiter = RateLimiter(float(os.getenv("OCR_MAX_RPS", "15")))
+        self._translation_sem = asyncio.Semaphore(int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "8")))
+        self._translation_rate_limiter = RateLimiter(float(os.getenv("TRANSLATION_MAX_RPS", "10")))
+        
+        # Async clients for the long-running OCR and translation jobs (used by the *_async methods)
+        self._aio_doc_client = AsyncDocumentAnalysisClient(
+            endpoint=self.doc_intel_endpoint,
+            credential=AzureKeyCredential(self.doc_intel_key),
+            polling_interval=ocr_polling_interval
+        )
+        self._aio_translation_client = AsyncDocumentTranslationClient(
+            self.translator_endpoint,
+            AzureKeyCredential(self.translator_key),
+            polling_interval=translation_polling_interval
+        )
+        
+        self.blob_service_client = self._get_shared_blob_service_client()
+        
+        if warm_connections:
+            threading.Thread(target=self._warm_pools, daemon=True).start()
+    
+    def _get_shared_blob_service_client(self):
+        """
+        Return the blob service client for this account and auth method,
+        creating it (with a pooled transport) on first use.
+        """
+        from azure.identity import DefaultAzureCredential
+        from azure.storage.blob import BlobServiceClient
+        
         account_url = f"https://{self.storage_account_name}.blob.core.windows.net"
+        key = (self.use_managed_identity, account_url, self.storage_connection_string)
         
-        if self.use_managed_identity:
-            # Use Managed Identity (for Azure-hosted environments)
-            credential = DefaultAzureCredential()
-            self.blob_service_client = BlobServiceClient(
-                account_url=account_url,
-                credential=credential
-            )
-        else:
-            # Use connection string or account key (for local development)
-            if self.storage_connection_string:
-                self.blob_service_client = BlobServiceClient.from_connection_string(
-                    self.storage_connection_string
-                )
-            else:
-                self.blob_service_client = BlobServiceClient(
+        with self._blob_service_clients_lock:
+            blob_service_client = self._blob_service_clients.get(key)
+            if blob_service_client is not None:
+                return blob_service_client
+            
+            # Initialize blob service client based on authentication method
+            if self.use_managed_identity:
+                # Use Managed Identity (for Azure-hosted environments)
+                credential = DefaultAzureCredential()
+                blob_service_client = BlobServiceClient(
                     account_url=account_url,
-                    credential=AzureKeyCredential(self.storage_account_key)
+                    credential=credential,
+                    transport=build_requests_transport()
                 )
+            else:
+                # Use connection string or account key (for local development)
+                if self.storage_connection_string:
+                    blob_service_client = BlobServiceClient.from_connection_string(
+                        self.storage_connection_string,
+                        transport=build_requests_transport()
+                    )
+                else:
+                    blob_service_client = BlobServiceClient(
+                        account_url=account_url,
+                        credential=AzureKeyCredential(self.storage_account_key),
+                        transport=build_requests_transport()
+                    )
+            
+            self._blob_service_clients[key] = blob_service_client
+            return blob_service_client
+    
+    async def aclose(self):
+        """Close the async SDK clients."""
+        await self._aio_doc_client.close()
+        await self._aio_translation_client.close()
+    
+    def _warm_pools(self):
+        """Issue cheap calls to each service so their connection pools are primed."""
+        warmups = [
+            ("blob storage", self.blob_service_client.get_account_information),
+            ("translator", self.translation_client.get_supported_document_formats),
+            ("document intelligence", lambda: self.doc_analysis_client.send_request(
+                HttpRequest("GET", "/formrecognizer/info?api-version=2023-07-31")
+            )),
+        ]
+        for name, warmup in warmups:
+            try:
+                warmup()
+            except Exception as e:
+                # Warm-up is best effort; real errors surface on the first real call
+                logger.debug("Connection warm-up for %s failed: %s", name, e)
     
-    def analyze_document_with_ocr(self, file_path):
+    def _ocr_cache_path(self, content_hash):
+        """Return the OCR cache file for a content hash, or None if caching is disabled."""
+        if not self.ocr_cache_dir:
+            return None
+        return os.path.join(self.ocr_cache_dir, f"{content_hash}.json.gz")
+    
+    def _load_cached_ocr_result(self, content_hash):
+        """
+        Look up a document in the OCR cache by the SHA-256 of its contents.
+        
+        Returns:
+            Tuple of (cache_path, result); cache_path is None when caching is disabled
+            or no content hash is known, and result is None on a cache miss
+        """
+        if not self.ocr_cache_dir or not content_hash:
+            return None, None
+        cache_path = self._ocr_cache_path(content_hash)
+        if os.path.exists(cache_path):
+            logger.info("✓ OCR result loaded from cache: %s", cache_path)
+            from azure.ai.formrecognizer import AnalyzeResult
+            return cache_path, AnalyzeResult.from_dict(_load_json_gz(cache_path))
+        return cache_path, None
+    
+    def _finish_ocr_result(self, result, cache_path):
+        """Log a completed OCR result and store it in the cache."""
+        logger.info(
+            "✓ OCR completed successfully! Pages analyzed: %d, paragraphs extracted: %d",
+            len(result.pages), len(result.paragraphs) if result.paragraphs else 0
+        )
+        
+        if cache_path:
+            try:
+                _dump_json_gz(result.to_dict(), cache_path)
+            except OSError as e:
+                logger.warning("OCR cache write note: %s", e)
+        
+        return result
+    
+    @retry_on_throttle(max_attempts=3, base=1.0, cap=32.0)
+    def analyze_document_with_ocr(self, file_path, content_hash=None, document=None, document_url=None):
         """
         Analyze a document using Azure Document Intelligence OCR.
         Supports all document formats including PDF, Office files, images, and more.
         
         Args:
             file_path: Path to the document file (any supported format)
+            content_hash: Optional precomputed SHA-256 of the file, used as the OCR cache key
+                          (without it the result is not cached)
+            document: Optional file contents (bytes or binary stream) already in memory;
+                      when given, the file is not read from disk again
+            document_url: Optional URL of a blob the service reads directly instead of
+                          uploading the file (results are not cached)
             
         Returns:
             Analysis result with extracted text and layout
         """
         try:
-            print(f"Starting OCR analysis of: {file_path}")
+            logger.info("Starting OCR analysis of: %s", file_path)
             
-            with open(file_path, "rb") as f:
+            cache_path, result = (None, None) if document_url else self._load_cached_ocr_result(content_hash)
+            if result is not None:
+                return result
+            
+            if document_url:
+                poller = self.doc_analysis_client.begin_analyze_document_from_url(
+                    "prebuilt-read",  # Use the read model for OCR
+                    document_url=document_url
+                )
+            elif document is not None:
                 poller = self.doc_analysis_client.begin_analyze_document(
                     "prebuilt-read",  # Use the read model for OCR
-                    document=f
+                    document=document
                 )
+            else:
+                # Stream the file in chunks rather than reading it all into memory first
+                with open(file_path, "rb") as f:
+                    poller = self.doc_analysis_client.begin_analyze_document(
+                        "prebuilt-read",  # Use the read model for OCR
+                        document=f
+                    )
             
-            print("OCR job submitted. Waiting for completion...")
+            logger.info("OCR job submitted. Waiting for completion...")
             result = poller.result()
             
-            print(f"✓ OCR completed successfully!")
-            print(f"  Pages analyzed: {len(result.pages)}")
-            print(f"  Paragraphs extracted: {len(result.paragraphs) if result.paragraphs else 0}")
+            return self._finish_ocr_result(result, cache_path)
             
-            return result
+        except Exception as e:
+            logger.error("Error during OCR analysis: %s", e)
+            raise
+    
+    @retry_on_throttle(max_attempts=3, base=1.0, cap=32.0)
+    async def analyze_document_with_ocr_async(self, file_path, content_hash=None, document=None, document_url=None):
+        """
+        Async version of analyze_document_with_ocr.
+        
+        The OCR job is submitted and awaited with the async Document Intelligence
+        client, so many documents can be analyzed concurrently in one process.
+        """
+        try:
+            logger.info("Starting OCR analysis of: %s", file_path)
+            
+            cache_path, result = (None, None) if document_url else await _run_blocking(self._load_cached_ocr_result, content_hash)
+            if result is not None:
+                return result
+            
+            async with self._ocr_sem:
+                await self._ocr_rate_limiter.acquire()
+                if document_url:
+                    poller = await self._aio_doc_client.begin_analyze_document_from_url(
+                        "prebuilt-read",  # Use the read model for OCR
+                        document_url=document_url
+                    )
+                elif document is not None:
+                    poller = await self._aio_doc_client.begin_analyze_document(
+                        "prebuilt-read",  # Use the read model for OCR
+                        document=document
+                    )
+                else:
+                    # Stream the file in chunks rather than reading it all into memory first
+                    with open(file_path, "rb") as f:
+                        poller = await self._aio_doc_client.begin_analyze_document(
+                            "prebuilt-read",  # Use the read model for OCR
+                            document=f
+                        )
+                
+                logger.info("OCR job submitted. Waiting for completion...")
+                result = await poller.result()
+            
+            return await _run_blocking(self._finish_ocr_result, result, cache_path)
             
         except Exception as e:
-            print(f"Error during OCR analysis: {e}")
+            logger.error("Error during OCR analysis: %s", e)
             raise
     
+    def analyze_batch(self, source_container_url, result_container_url, prefix=None):
+        """
+        OCR every document in a blob container with a single batch analyze operation.
+        One long-running operation covers the whole container instead of one per document.
+        The results are written as JSON files to the result container.
+        
+        Requires the optional azure-ai-documentintelligence package.
+        
+        Args:
+            source_container_url: Container URL (with SAS token if not using Managed Identity)
+                                  holding the documents to analyze
+            result_container_url: Container URL (with write SAS token if not using Managed
+                                  Identity) that receives the analyze results
+            prefix: Optional blob name prefix limiting which documents are analyzed
+            
+        Returns:
+            List of per-document details (source_url, result_url, status, error)
+        """
+        try:
+            from azure.ai.documentintelligence import DocumentIntelligenceClient
+            from azure.ai.documentintelligence.models import AnalyzeBatchDocumentsRequest, AzureBlobContentSource
+        except ImportError:
+            # azure-ai-documentintelligence is optional; it is only needed for analyze_batch
+            raise RuntimeError("Batch analysis requires the azure-ai-documentintelligence package")
+        
+        try:
+            logger.info("Starting batch OCR analysis of: %s", source_container_url.split('?')[0])
+            
+            client = DocumentIntelligenceClient(
+                endpoint=self.doc_intel_endpoint,
+                credential=AzureKeyCredential(self.doc_intel_key)
+            )
+            with client:
+                poller = client.begin_analyze_batch_documents(
+                    model_id="prebuilt-read",
+                    body=AnalyzeBatchDocumentsRequest(
+                        azure_blob_source=AzureBlobContentSource(container_url=source_container_url, prefix=prefix),
+                        result_container_url=result_container_url,
+                        overwrite_existing=True
+                    )
+                )
+                logger.info("Batch OCR job submitted. Waiting for completion...")
+                result = poller.result()
+            
+            # The poller can finish while the operation itself failed, so check its status too
+            if poller.status().lower() != "succeeded":
+                raise RuntimeError(f"Batch OCR operation ended with status: {poller.status()}")
+            
+            logger.info(
+                "✓ Batch OCR completed! Succeeded: %s, failed: %s, skipped: %s",
+                result.succeeded_count, result.failed_count, result.skipped_count
+            )
+            for detail in result.details or []:
+                if detail.status == "failed":
+                    logger.error("✗ Batch OCR failed for %s: %s", detail.source_url, detail.error.message if detail.error else detail.status)
+            
+            return list(result.details or [])
+            
+        except Exception as e:
+            logger.error("Error during batch OCR analysis: %s", e)
+            raise
+    
+    def _write_ocr_text(self, ocr_result, text_output_path):
+        """
+        Write the OCR text to a .txt file, one "=== Page N ===" section per page.
+        
+        Args:
+            ocr_result: OCR analysis result from Document Intelligence
+            text_output_path: Path of the text file to write
+        """
+        # Group paragraphs by page in one pass instead of rescanning them for every page
+        paragraphs_by_page = defaultdict(list)
+        if ocr_result.content:
+            for paragraph in ocr_result.paragraphs or []:
+                for region in paragraph.bounding_regions or []:
+                    paragraphs_by_page[region.page_number].append(paragraph.content)
+        
+        # Stream each page to the file instead of building the whole text in memory
+        with open(text_output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            for page_num in range(1, len(ocr_result.pages) + 1):
+                f.write(f"=== Page {page_num} ===\n")
+                f.writelines(content + "\n\n" for content in paragraphs_by_page[page_num])
+        
+        logger.info("✓ OCR text extracted to: %s", text_output_path)
+    
     def create_searchable_document(self, original_file_path, ocr_result, output_path):
         """
         Create a searchable document by extracting OCR text and preserving the original file.
@@ -167,102 +642,464 @@ class OCRTranslationPipeline:
             output_path: Path to save the searchable document
         """
         try:
-            print("Creating searchable PDF with OCR data...")
-            
-            # For this example, we'll extract text and metadata
-            # In a production scenario, you might want to embed the text layer into the PDF
-            
-            # Extract all text content
-            text_content = []
-            for page_num, page in enumerate(ocr_result.pages, start=1):
-                text_content.append(f"=== Page {page_num} ===\n")
-                if ocr_result.content:
-                    # Get content for this page
-                    page_text = ""
-                    for paragraph in ocr_result.paragraphs:
-                        if paragraph.bounding_regions:
-                            for region in paragraph.bounding_regions:
-                                if region.page_number == page_num:
-                                    page_text += paragraph.content + "\n\n"
-                    text_content.append(page_text)
+            logger.info("Creating searchable PDF with OCR data...")
             
             # Save the extracted text alongside the document
             # Preserve original file extension for output
             base_output = os.path.splitext(output_path)[0]
             original_ext = os.path.splitext(original_file_path)[1]
-            text_output_path = f"{base_output}_ocr_text.txt"
-            
-            with open(text_output_path, 'w', encoding='utf-8') as f:
-                f.write(''.join(text_content))
-            
-            print(f"✓ OCR text extracted to: {text_output_path}")
+            self._write_ocr_text(ocr_result, f"{base_output}_ocr_text.txt")
             
-            # Copy the original document to the output location with proper extension
-            import shutil
+            # Embed the OCR text as an invisible layer for PDFs so the translator
+            # reads the text directly; other formats are copied unchanged
             output_with_ext = f"{base_output}{original_ext}"
-            shutil.copy2(original_file_path, output_with_ext)
+            embedded = False
+            if original_ext.lower() == ".pdf" and pikepdf is not None:
+                try:
+                    self._embed_text_layer(original_file_path, ocr_result, output_with_ext)
+                    embedded = True
+                    logger.info("✓ Embedded invisible OCR text layer")
+                except Exception as e:
+                    logger.warning("Could not embed OCR text layer, copying original instead: %s", e)
+            if not embedded:
+                _copy_file(original_file_path, output_with_ext)
             
-            print(f"✓ Searchable document created: {output_with_ext}")
-            print(f"  Original format: {original_ext}")
+            logger.info("✓ Searchable document created: %s (original format: %s)", output_with_ext, original_ext)
             
             return output_with_ext
             
-            return output_path
+        except Exception as e:
+            logger.error("Error creating searchable PDF: %s", e)
+            raise
+    
+    def _embed_text_layer(self, original_pdf_path, ocr_result, output_path):
+        """
+        Write a copy of a PDF with the OCR words overlaid as invisible text.
+        
+        Each word is drawn with text render mode 3 (invisible) at its OCR polygon,
+        scaled from Document Intelligence page units to the PDF mediabox.
+        
+        Args:
+            original_pdf_path: Path to the original PDF
+            ocr_result: OCR analysis result from Document Intelligence
+            output_path: Path to save the PDF with the text layer
+        """
+        with pikepdf.open(original_pdf_path) as pdf:
+            # Build one overlay page per PDF page, sized to that page's mediabox
+            overlay_buffer = BytesIO()
+            # invariant/deterministic_id keep the output byte-stable across runs so the
+            # content-hash upload check can recognise an unchanged document
+            overlay = pdf_canvas.Canvas(overlay_buffer, invariant=1)
+            for page_index, pdf_page in enumerate(pdf.pages):
+                x0, y0, x1, y1 = (float(v) for v in pdf_page.mediabox)
+                width, height = x1 - x0, y1 - y0
+                overlay.setPageSize((width, height))
+                if page_index < len(ocr_result.pages):
+                    ocr_page = ocr_result.pages[page_index]
+                    scale_x = width / ocr_page.width if ocr_page.width else 1.0
+                    scale_y = height / ocr_page.height if ocr_page.height else 1.0
+                    for word in ocr_page.words or []:
+                        if not word.polygon or not word.content:
+                            continue
+                        xs = [point.x for point in word.polygon]
+                        ys = [point.y for point in word.polygon]
+                        word_width = (max(xs) - min(xs)) * scale_x
+                        font_size = max((max(ys) - min(ys)) * scale_y, 1.0)
+                        text = overlay.beginText()
+                        text.setTextRenderMode(3)
+                        text.setFont("Helvetica", font_size)
+                        natural_width = overlay.stringWidth(word.content, "Helvetica", font_size)
+                        if natural_width > 0 and word_width > 0:
+                            text.setHorizScale(100.0 * word_width / natural_width)
+                        # Document Intelligence measures from the top-left, PDF from the bottom-left
+                        text.setTextOrigin(min(xs) * scale_x, height - max(ys) * scale_y)
+                        text.textOut(word.content)
+                        overlay.drawText(text)
+                overlay.showPage()
+            overlay.save()
+            
+            overlay_buffer.seek(0)
+            with pikepdf.open(overlay_buffer) as overlay_pdf:
+                for pdf_page, overlay_page in zip(pdf.pages, overlay_pdf.pages):
+                    # Attach the overlay as a form XObject under a fixed name (add_overlay
+                    # picks a random one) and draw it after the page's own content
+                    form = pdf.copy_foreign(overlay_page.as_form_xobject())
+                    name = pdf_page.add_resource(form, pikepdf.Name.XObject, pikepdf.Name("/OcrTextLayer"))
+                    x0, y0 = float(pdf_page.mediabox[0]), float(pdf_page.mediabox[1])
+                    pdf_page.contents_add(pdf.make_stream(b"q\n"), prepend=True)
+                    pdf_page.contents_add(
+                        pdf.make_stream(f"Q\nq 1 0 0 1 {x0:g} {y0:g} cm {name} Do Q\n".encode("ascii"))
+                    )
+                pdf.save(output_path, deterministic_id=True)
+    
+    def _has_text_layer(self, file_path, sample_pages=3, min_chars_per_page=200):
+        """
+        Check whether a PDF already contains an extractable text layer.
+        
+        Args:
+            file_path: Path to the PDF, or a binary stream of its contents
+            sample_pages: Number of leading pages to sample
+            min_chars_per_page: Average extracted characters per page required
+            
+        Returns:
+            True if the sampled pages contain enough text to skip OCR
+        """
+        if pypdf is None:
+            return False
+        try:
+            reader = pypdf.PdfReader(file_path)
+            sample = reader.pages[:min(sample_pages, len(reader.pages))]
+            chars = sum(len(page.extract_text() or '') for page in sample)
+            return chars / max(len(sample), 1) > min_chars_per_page
+        except Exception as e:
+            logger.debug("Text layer probe failed for %s: %s", file_path, e)
+            return False
+    
+    def create_document_from_text_layer(self, original_file_path, output_path):
+        """
+        Create the searchable document outputs for a PDF that already has a text layer.
+        Writes the PDF's own text to the .txt file and copies the original unchanged.
+        
+        Args:
+            original_file_path: Path to the original PDF
+            output_path: Path to save the searchable document
+        """
+        base_output = os.path.splitext(output_path)[0]
+        text_output_path = f"{base_output}_ocr_text.txt"
+        
+        reader = pypdf.PdfReader(original_file_path)
+        with open(text_output_path, 'w', encoding='utf-8') as f:
+            for page_num, page in enumerate(reader.pages, start=1):
+                f.write(f"=== Page {page_num} ===\n")
+                f.write((page.extract_text() or '') + "\n\n")
+        logger.info("✓ Existing text layer extracted to: %s", text_output_path)
+        
+        _copy_file(original_file_path, output_path)
+        logger.info("✓ Searchable document created: %s", output_path)
+        return output_path
+    
+    def _get_sas(self, container_name, permission):
+        """
+        Return a 24-hour container SAS token, reusing a cached token until it is
+        within an hour of expiring.
+        
+        Tokens are only signed per container (they also authorize the blobs in it),
+        so the cache holds one entry per container and permission set in use.
+        
+        Args:
+            container_name: Name of the blob container
+            permission: ContainerSasPermissions
+            
+        Returns:
+            SAS token string
+        """
+        from azure.storage.blob import generate_container_sas
+        
+        key = (container_name, str(permission))
+        now = datetime.now(timezone.utc)
+        cached = self._sas_cache.get(key)
+        if cached and now + timedelta(hours=1) < cached[1]:
+            return cached[0]
+        
+        expiry = now + timedelta(hours=24)
+        token = generate_container_sas(
+            account_name=self.storage_account_name,
+            container_name=container_name,
+            account_key=self.storage_account_key,
+            permission=permission,
+            expiry=expiry
+        )
+        self._sas_cache[key] = (token, expiry)
+        return token
+    
+    def _get_blob_client(self, container_name, blob_name):
+        """Return a cached BlobClient for the given container and blob."""
+        key = (container_name, blob_name)
+        with self._blob_clients_lock:
+            blob_client = self._blob_clients.get(key)
+            if blob_client is None:
+                blob_client = self.blob_service_client.get_blob_client(
+                    container=container_name,
+                    blob=blob_name
+                )
+                self._blob_clients[key] = blob_client
+                if len(self._blob_clients) > BLOB_CLIENT_CACHE_SIZE:
+                    self._blob_clients.popitem(last=False)
+            else:
+                self._blob_clients.move_to_end(key)
+        return blob_client
+    
+    def _credential_for_blob_url(self, blob_url):
+        """
+        Pick the credential for a blob URL outside this pipeline's storage account.
+        
+        Returns:
+            None when the URL carries a SAS token, otherwise DefaultAzureCredential
+            with Managed Identity (or None, for public blobs, with key auth)
+        """
+        if "sig=" in urlparse(blob_url).query:
+            return None
+        from azure.identity import DefaultAzureCredential
+        return DefaultAzureCredential() if self.use_managed_identity else None
+    
+    def _blob_client_for_url(self, blob_url):
+        """
+        Get a BlobClient for a blob URL.
+        
+        Blobs in this pipeline's storage account reuse the shared service client
+        (and its connection pool); other accounts get a client built from the URL.
+        """
+        if urlparse(blob_url).netloc.lower() == urlparse(self.blob_service_client.url).netloc.lower():
+            container_name, blob_name = parse_blob_url(blob_url)
+            return self._get_blob_client(container_name, blob_name)
+        from azure.storage.blob import BlobClient
+        return BlobClient.from_blob_url(blob_url, credential=self._credential_for_blob_url(blob_url))
+    
+    def _blob_has_content_hash(self, blob_client, content_hash):
+        """Check whether an existing blob was uploaded with the given SHA-256 metadata."""
+        try:
+            props = blob_client.get_blob_properties()
+        except ResourceNotFoundError:
+            return False
+        return (props.metadata or {}).get("sha256") == content_hash
+    
+    def _create_container_if_missing(self, container_name):
+        """
+        Create a blob container, tolerating one that already exists.
+        Containers seen before in this process are skipped without a request.
+        
+        Returns:
+            True if the container was created by this call, False if it already existed,
+            None if that could not be determined
+        """
+        key = (self.storage_account_name, container_name)
+        if key in self._known_containers:
+            return False
+        
+        container_client = self.blob_service_client.get_container_client(container_name)
+        created = False
+        try:
+            # Create container without public access (SAS tokens will provide access)
+            container_client.create_container()
+            created = True
+        except ResourceExistsError:
+            # Container already exists, which is fine
+            pass
+        except Exception as e:
+            logger.warning("Container creation note: %s", e)
+            return None
+        
+        self._known_containers.add(key)
+        return created
+    
+    @retry_on_throttle(max_attempts=3, base=1.0, cap=32.0)
+    def copy_blob_from_url(self, source_url, container_name, blob_name):
+        """
+        Copy a blob into this storage account server side, without downloading it.
+        
+        Args:
+            source_url: URL of the source blob (with SAS token if not publicly readable)
+            container_name: Name of the destination blob container
+            blob_name: Name of the destination blob
+            
+        Returns:
+            URL of the destination blob
+        """
+        try:
+            self._create_container_if_missing(container_name)
+            
+            blob_client = self._get_blob_client(container_name, blob_name)
+            copy_blob_and_wait(blob_client, source_url)
+            
+            logger.info("Copied %s to %s/%s", source_url.split('?')[0], container_name, blob_name)
+            return blob_client.url
             
         except Exception as e:
-            print(f"Error creating searchable PDF: {e}")
+            logger.error("Error copying blob: %s", e)
             raise
     
-    def upload_to_blob(self, file_path, container_name):
+    @retry_on_throttle(max_attempts=3, base=1.0, cap=32.0)
+    def upload_to_blob(self, file_path, container_name, content_hash=None, data=None):
         """
         Upload a file to Azure Blob Storage.
         
         Args:
-            file_path: Path to the file
+            file_path: Path to the file (its basename is used as the blob name)
             container_name: Name of the blob container
+            content_hash: Optional SHA-256 of the file, stored as blob metadata
+            data: Optional file contents already in memory; when given, the file is not read again
             
         Returns:
             URL with SAS token
         """
         try:
-            # Create container if it doesn't exist
-            container_client = self.blob_service_client.get_container_client(container_name)
-            try:
-                # Create container without public access (SAS tokens will provide access)
-                container_client.create_container()
-            except Exception as e:
-                # Container might already exist, which is fine
-                if "ContainerAlreadyExists" not in str(e) and "already exists" not in str(e).lower():
-                    print(f"Container creation note: {e}")
+            self._create_container_if_missing(container_name)
             
             # Upload the file
             blob_name = os.path.basename(file_path)
-            blob_client = container_client.get_blob_client(blob_name)
+            blob_client = self._get_blob_client(container_name, blob_name)
             
-            with open(file_path, "rb") as data:
-                blob_client.upload_blob(data, overwrite=True)
+            if content_hash and self._blob_has_content_hash(blob_client, content_hash):
+                # Identical content is already uploaded (e.g. re-run after a downstream failure)
+                logger.info("Blob %s already up to date, skipping upload", blob_name)
+            else:
+                metadata = {"sha256": content_hash} if content_hash else None
+                upload_kwargs = {
+                    "overwrite": True,
+                    "metadata": metadata,
+                    "blob_type": "BlockBlob",
+                    "max_concurrency": BLOB_TRANSFER_CONCURRENCY
+                }
+                if data is not None:
+                    blob_client.upload_blob(BytesIO(data), **upload_kwargs)
+                else:
+                    # Pass the open handle so the SDK reads and uploads it block by block
+                    with open(file_path, "rb") as f:
+                        blob_client.upload_blob(f, **upload_kwargs)
             
             # Return URL (with or without SAS token based on authentication method)
             if self.use_managed_identity:
                 # With Managed Identity, return plain URL
                 return blob_client.url
             else:
-                # Generate SAS token with proper permissions
-                sas_token = generate_blob_sas(
-                    account_name=self.storage_account_name,
-                    container_name=container_name,
-                    blob_name=blob_name,
-                    account_key=self.storage_account_key,
-                    permission=BlobSasPermissions(read=True, list=True),
-                    expiry=datetime.utcnow() + timedelta(hours=24)
-                )
+                # Reuse the container's cached read SAS instead of signing one per blob
+                from azure.storage.blob import ContainerSasPermissions
+                sas_token = self._get_sas(container_name, ContainerSasPermissions(read=True, list=True))
                 return f"{blob_client.url}?{sas_token}"
             
         except Exception as e:
-            print(f"Error uploading to blob: {e}")
+            logger.error("Error uploading to blob: %s", e)
             raise
     
-    def translate_document(self, file_path, target_language, source_container="ocr-source", target_container="ocr-target", source_language=None):
+    def _prepare_translation(self, file_path, target_language, source_container, target_container, source_language=None, content_hash=None, data=None, source_url=None):
+        """
+        Upload the document and set up the containers for a translation job.
+        
+        The job translates exactly this document's blob into an output blob named for
+        this job, so several documents - or the same document into several languages -
+        can be translated concurrently through the same containers.
+        
+        Returns:
+            DocumentTranslationInput for begin_translation
+        """
+        from azure.ai.translation.document import DocumentTranslationInput, TranslationTarget
+        from azure.storage.blob import ContainerSasPermissions
+        
+        # Check if source and target languages are the same
+        if source_language and source_language.lower() == target_language.lower():
+            error_msg = f"Source language ({source_language}) and target language ({target_language}) are the same - no translation needed"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        blob_name = parse_blob_url(file_path)[1] if is_blob_url(file_path) else os.path.basename(file_path)
+        
+        # The source upload and the target container setup are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            target_ready = executor.submit(self._create_container_if_missing, target_container)
+            
+            # Upload source document (this uploads the file but we need container URL)
+            if source_url:
+                # The document is already in blob storage, so copy it server side instead
+                self.copy_blob_from_url(source_url, source_container, blob_name)
+            else:
+                self.upload_to_blob(file_path, source_container, content_hash=content_hash, data=data)
+            
+            target_ready.result()
+        
+        # Generate source container URL with SAS token
+        # Note: the SAS is signed (and cached) per container, then appended to the blob URL
+        if self.use_managed_identity:
+            # With Managed Identity, use container URL directly
+            source_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}"
+        else:
+            # Generate SAS token for source container using container-specific function
+            source_sas_token = self._get_sas(source_container, ContainerSasPermissions(read=True, list=True))
+            source_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}?{source_sas_token}"
+        
+        # Generate target URL (with or without SAS token)
+        if self.use_managed_identity:
+            # With Managed Identity, no SAS token needed
+            target_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container}"
+        else:
+            # Use container-specific SAS generation for proper permissions
+            target_sas = self._get_sas(
+                target_container,
+                ContainerSasPermissions(write=True, read=True, list=True, create=True, add=True)
+            )
+            target_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container}?{target_sas}"
+        
+        # Build translation input with optional source language, limited to this document.
+        # The output name is unique to the job: the source blob is shared by every job on
+        # the same document, so reusing its name would let concurrent jobs clobber each other
+        target_blob_name = f"{uuid.uuid4().hex[:12]}-{blob_name}"
+        translation_kwargs = {
+            'source_url': blob_url_in_container(source_url, blob_name),
+            'targets': [TranslationTarget(
+                target_url=blob_url_in_container(target_url, target_blob_name),
+                language=target_language
+            )],
+            'storage_type': "File"
+        }
+        
+        # Add source language if specified (otherwise Azure will auto-detect)
+        if source_language:
+            translation_kwargs['source_language'] = source_language
+            logger.info("Using specified source language: %s", source_language)
+        else:
+            logger.info("Using auto-detection for source language")
+        
+        return DocumentTranslationInput(**translation_kwargs)
+    
+    def _handle_translation_result(self, documents, target_language):
+        """
+        Turn the per-document statuses of a finished translation job into the result dict.
+        
+        Returns:
+            Dictionary with translated URL and detected source language, or None on failure
+        """
+        for document in documents:
+            if document.status == "Succeeded":
+                # Note: Azure Document Translation API does not expose detected source language
+                detected_lang = 'auto-detected'
+                logger.info("✓ OCR Translation successful - Source: %s → Target: %s", detected_lang, target_language)
+                return {
+                    'url': document.translated_document_url,
+                    'detected_source_language': detected_lang
+                }
+            elif document.status == "Failed":
+                error_code = document.error.code if document.error else 'Unknown'
+                error_msg = document.error.message if document.error else 'Unknown error'
+                logger.error(
+                    "✗ OCR Translation failed - Target: %s | Code: %s, Message: %s",
+                    target_language, error_code, error_msg
+                )
+                return None
+        return None
+    
+    @retry_on_throttle(max_attempts=3, base=1.0, cap=32.0)
+    def _run_translation_job(self, translation_input):
+        """
+        Submit a prepared translation job and wait for its document statuses.
+        
+        Only this step is retried on throttling, so a 429 from Translator does
+        not re-run the upload or clear the target again.
+        """
+        poller = self.translation_client.begin_translation([translation_input])
+        logger.info("Translation job submitted. Waiting for completion...")
+        return poller.result()
+    
+    @retry_on_throttle(max_attempts=3, base=1.0, cap=32.0)
+    async def _run_translation_job_async(self, translation_input):
+        """Async version of _run_translation_job, bounded by the translation semaphore and rate limit."""
+        async with self._translation_sem:
+            await self._translation_rate_limiter.acquire()
+            poller = await self._aio_translation_client.begin_translation([translation_input])
+            logger.info("Translation job submitted. Waiting for completion...")
+            
+            result = await poller.result()
+            return [document async for document in result]
+    
+    def translate_document(self, file_path, target_language, source_container="ocr-source", target_container="ocr-target", source_language=None, content_hash=None, data=None, source_url=None):
         """
         Translate the document.
         
@@ -272,118 +1109,50 @@ class OCRTranslationPipeline:
             source_container: Source blob container name
             target_container: Target blob container name
             source_language: Optional source language code (if not provided, auto-detect)
+            content_hash: Optional precomputed SHA-256 of the file
+            data: Optional file contents already in memory, uploaded instead of re-reading file_path
+            source_url: Optional URL of a blob holding the document; it is copied server side
+                        instead of uploading file_path
             
         Returns:
             URL of the translated document
         """
         try:
-            print(f"\nStarting translation to {target_language}...")
-            
-            # Upload source document (this uploads the file but we need container URL)
-            self.upload_to_blob(file_path, source_container)
-            
-            # Generate source container URL with SAS token
-            # Note: Azure Translator needs container-level access, not individual blob URLs
-            if self.use_managed_identity:
-                # With Managed Identity, use container URL directly
-                source_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}"
-            else:
-                # Generate SAS token for source container using container-specific function
-                source_sas_token = generate_container_sas(
-                    account_name=self.storage_account_name,
-                    container_name=source_container,
-                    account_key=self.storage_account_key,
-                    permission=ContainerSasPermissions(read=True, list=True),
-                    expiry=datetime.utcnow() + timedelta(hours=24)
-                )
-                source_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}?{source_sas_token}"
+            logger.info("Starting translation to %s...", target_language)
+            translation_input = self._prepare_translation(
+                file_path, target_language, source_container, target_container,
+                source_language=source_language, content_hash=content_hash, data=data, source_url=source_url
+            )
             
-            # Set up target container
-            target_container_client = self.blob_service_client.get_container_client(target_container)
-            try:
-                # Create container without public access (SAS tokens will provide access)
-                target_container_client.create_container()
-                print(f"Created target container: {target_container}")
-            except Exception as e:
-                # Container might already exist, which is fine
-                if "ContainerAlreadyExists" in str(e) or "already exists" in str(e).lower():
-                    print(f"Target container {target_container} already exists")
-                    # Clear existing blobs to avoid TargetFileAlreadyExists error
-                    print("Clearing existing files from target container...")
-                    blobs = target_container_client.list_blobs()
-                    for blob in blobs:
-                        target_container_client.delete_blob(blob.name)
-                        print(f"  Deleted: {blob.name}")
-                else:
-                    print(f"Target container creation note: {e}")
+            result = self._run_translation_job(translation_input)
+            return self._handle_translation_result(result, target_language)
             
-            # Generate target URL (with or without SAS token)
-            if self.use_managed_identity:
-                # With Managed Identity, no SAS token needed
-                target_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container}"
-            else:
-                # Use container-specific SAS generation for proper permissions
-                target_sas = generate_container_sas(
-                    account_name=self.storage_account_name,
-                    container_name=target_container,
-                    account_key=self.storage_account_key,
-                    permission=ContainerSasPermissions(write=True, read=True, list=True, create=True, add=True),
-                    expiry=datetime.utcnow() + timedelta(hours=24)
+        except Exception as e:
+            logger.error("Error during OCR translation: %s", e, exc_info=True)
+            raise
+    
+    async def translate_document_async(self, file_path, target_language, source_container="ocr-source", target_container="ocr-target", source_language=None, content_hash=None, data=None, source_url=None, translation_input=None):
+        """
+        Async version of translate_document.
+        
+        Blob setup runs in a worker thread; the translation job is submitted and
+        awaited with the async Translator client, so no thread is held while polling.
+        A translation_input already prepared by _prepare_translation skips the setup.
+        """
+        try:
+            logger.info("Starting translation to %s...", target_language)
+            if translation_input is None:
+                translation_input = await _run_blocking(
+                    self._prepare_translation,
+                    file_path, target_language, source_container, target_container,
+                    source_language=source_language, content_hash=content_hash, data=data, source_url=source_url
                 )
-                target_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container}?{target_sas}"
-            
-            # Check if source and target languages are the same
-            if source_language and source_language.lower() == target_language.lower():
-                error_msg = f"Source language ({source_language}) and target language ({target_language}) are the same - no translation needed"
-                print(f"Error: {error_msg}")
-                raise ValueError(error_msg)
-            
-            # Start translation
-            # Build translation input with optional source language
-            translation_kwargs = {
-                'source_url': source_url,
-                'targets': [TranslationTarget(target_url=target_url, language=target_language)]
-            }
-            
-            # Add source language if specified (otherwise Azure will auto-detect)
-            if source_language:
-                translation_kwargs['source_language'] = source_language
-                print(f"Using specified source language: {source_language}")
-            else:
-                print("Using auto-detection for source language")
-            
-            translation_input = DocumentTranslationInput(**translation_kwargs)
             
-            poller = self.translation_client.begin_translation([translation_input])
-            print("Translation job submitted. Waiting for completion...")
-            
-            result = poller.result()
-            
-            for document in result:
-                if document.status == "Succeeded":
-                    print(f"✓ Translation completed successfully!")
-                    # Note: Azure Document Translation API does not expose detected source language
-                    detected_lang = 'auto-detected'
-                    print(f"  📝 Detected source language: {detected_lang}")
-                    logger.info(f"✓ OCR Translation successful - Source: {detected_lang} → Target: {target_language}")
-                    return {
-                        'url': document.translated_document_url,
-                        'detected_source_language': detected_lang
-                    }
-                elif document.status == "Failed":
-                    error_code = document.error.code if document.error else 'Unknown'
-                    error_msg = document.error.message if document.error else 'Unknown error'
-                    logger.error(f"OCR Translation failed - Target: {target_language} | Code: {error_code}, Message: {error_msg}")
-                    
-                    print(f"✗ Translation failed!")
-                    print(f"  Target language: {target_language}")
-                    print(f"  Error code: {error_code}")
-                    print(f"  Error message: {error_msg}")
-                    return None
+            documents = await self._run_translation_job_async(translation_input)
+            return self._handle_translation_result(documents, target_language)
             
         except Exception as e:
-            logger.error(f"Error during OCR translation: {e}", exc_info=True)
-            print(f"Error during translation: {e}")
+            logger.error("Error during OCR translation: %s", e, exc_info=True)
             raise
     
     def download_from_blob(self, blob_url, output_path):
@@ -395,120 +1164,371 @@ class OCRTranslationPipeline:
             output_path: Local path to save the file
         """
         try:
-            url_parts = blob_url.split('?')[0].split('/')
-            container_name = url_parts[-2]
-            blob_name = url_parts[-1]
-            
-            blob_client = self.blob_service_client.get_blob_client(
-                container=container_name,
-                blob=blob_name
-            )
+            blob_client = self._blob_client_for_url(blob_url)
             
+            # Stream straight into the file rather than buffering the whole blob
             with open(output_path, "wb") as download_file:
-                download_file.write(blob_client.download_blob().readall())
+                blob_client.download_blob(max_concurrency=BLOB_TRANSFER_CONCURRENCY).readinto(download_file)
             
-            print(f"Downloaded to: {output_path}")
+            logger.info("Downloaded to: %s", output_path)
             
         except Exception as e:
-            print(f"Error downloading: {e}")
+            logger.error("Error downloading: %s", e)
             raise
     
-    def process_document(self, input_file_path, target_language, output_folder="output", source_language=None):
+    def _start_pipeline(self, input_file_path, target_language, output_folder, force_ocr):
+        """
+        Read the input document and decide whether OCR is needed.
+        
+        Blob URL inputs are read by the services directly and copied server side;
+        they are only downloaded when an OCR text layer has to be embedded locally.
+        
+        Returns:
+            Dictionary describing the job, shared by the later pipeline stages
+        """
+        os.makedirs(output_folder, exist_ok=True)
+        
+        source_url = input_file_path if is_blob_url(input_file_path) else None
+        name = document_name(input_file_path)
+        
+        # Get file extension and base name
+        file_ext = os.path.splitext(name)[1]
+        base_name = os.path.splitext(name)[0]
+        
+        logger.info(
+            "STARTING OCR + TRANSLATION PIPELINE - Input: %s | Format: %s | Target language: %s",
+            input_file_path.split('?')[0], file_ext, target_language
+        )
+        
+        if source_url and not (file_ext.lower() == ".pdf" and pikepdf is not None):
+            # The searchable document is a plain copy, so it never has to touch local disk
+            blob_name = f"{base_name}_searchable{file_ext}"
+            return {
+                'input_file_path': input_file_path,
+                'source_url': source_url,
+                'file_ext': file_ext,
+                'base_name': base_name,
+                'output_folder': output_folder,
+                'searchable_doc_path': self._get_blob_client("ocr-source", blob_name).url,
+                'document_bytes': None,
+                'content_hash': None,
+                'upload_data': None,
+                'upload_hash': None,
+                'needs_ocr': True,
+                'upload_is_input': True
+            }
+        
+        # Read the input once and share the bytes between hashing, OCR and upload.
+        # The hash is the OCR cache key and, when the searchable document is a
+        # plain copy, also the upload metadata
+        if source_url:
+            # Embedding a text layer needs the PDF locally
+            document_bytes = self._blob_client_for_url(source_url).download_blob(
+                max_concurrency=BLOB_TRANSFER_CONCURRENCY
+            ).readall()
+            input_file_path = os.path.join(output_folder, name)
+            with open(input_file_path, "wb") as f:
+                f.write(document_bytes)
+        else:
+            document_bytes = _read_file(input_file_path)
+        content_hash = hashlib.sha256(document_bytes).hexdigest()
+        
+        job = {
+            'source_url': None,
+            'input_file_path': input_file_path,
+            'file_ext': file_ext,
+            'base_name': base_name,
+            'output_folder': output_folder,
+            'searchable_doc_path': os.path.join(output_folder, f"{base_name}_searchable{file_ext}"),
+            'document_bytes': document_bytes,
+            'content_hash': content_hash,
+            'upload_data': document_bytes,
+            'upload_hash': content_hash,
+            'needs_ocr': force_ocr or file_ext.lower() != ".pdf" or not self._has_text_layer(BytesIO(document_bytes))
+        }
+        job['upload_is_input'] = not (job['needs_ocr'] and file_ext.lower() == ".pdf" and pikepdf is not None)
+        return job
+    
+    def _build_searchable_document(self, job, ocr_result):
+        """Write the searchable document (and OCR text) for a job."""
+        if ocr_result is None:
+            # Digitally generated PDF: OCR would add cost and latency for no benefit
+            logger.info("STEP 1-2: PDF already has a text layer, skipping OCR")
+            self.create_document_from_text_layer(job['input_file_path'], job['searchable_doc_path'])
+            return
+        
+        # Step 2: Create Searchable Document with OCR text
+        logger.info("STEP 2: Extracting OCR Text")
+        if job['source_url']:
+            # The searchable document is the server-side copy made before translation
+            self._write_ocr_text(ocr_result, os.path.join(job['output_folder'], f"{job['base_name']}_searchable_ocr_text.txt"))
+            return
+        self.create_searchable_document(job['input_file_path'], ocr_result, job['searchable_doc_path'])
+        # An embedded text layer changes the bytes, so upload the new file instead
+        if not job['upload_is_input']:
+            job['upload_data'] = _read_file(job['searchable_doc_path'])
+            job['upload_hash'] = hashlib.sha256(job['upload_data']).hexdigest()
+    
+    def _finish_pipeline(self, job, translation_result, target_language):
+        """Download the translated document and build the pipeline result."""
+        if not translation_result:
+            logger.error("✗ Translation failed")
+            return None
+        
+        # Step 4: Download translated document
+        logger.info("STEP 4: Downloading Translated Document")
+        
+        # Handle both old string format and new dict format
+        if isinstance(translation_result, dict):
+            translated_url = translation_result['url']
+            detected_lang = translation_result.get('detected_source_language', 'unknown')
+        else:
+            translated_url = translation_result
+            detected_lang = 'unknown'
+        
+        file_ext = job['file_ext']
+        output_folder = job['output_folder']
+        base_name = job['base_name']
+        searchable_doc_path = job['searchable_doc_path']
+        translated_doc_path = os.path.join(
+            output_folder,
+            f"{base_name}_translated_{target_language}{file_ext}"
+        )
+        self.download_from_blob(translated_url, translated_doc_path)
+        
+        # Get OCR text file path
+        ocr_text_path = os.path.join(output_folder, f"{base_name}_searchable_ocr_text.txt")
+        
+        # Log completion with output paths and detected language
+        logger.info(
+            "PIPELINE COMPLETED SUCCESSFULLY!\n"
+            "  ✓ OCR text: %s\n"
+            "  ✓ Searchable document: %s\n"
+            "  ✓ Translated document: %s\n"
+            "  📝 Detected source language: %s\n"
+            "  🎯 Target language: %s",
+            ocr_text_path, searchable_doc_path, translated_doc_path, detected_lang, target_language
+        )
+        logger.info("OCR Pipeline completed - Format: %s | Source: %s → Target: %s", file_ext, detected_lang, target_language)
+        
+        return {
+            'ocr_text': ocr_text_path,
+            'searchable_document': searchable_doc_path,
+            'translated_document': translated_doc_path,
+            'detected_source_language': detected_lang
+        }
+    
+    def _result_cache_dir(self, job, target_language, source_language):
+        """Return the cache directory for a finished pipeline run, or None if caching is disabled."""
+        if not self.ocr_cache_dir or not job['content_hash']:
+            return None
+        return os.path.join(
+            self.ocr_cache_dir, "results",
+            f"{job['content_hash']}_{source_language or 'auto'}_{target_language}"
+        )
+    
+    def _load_cached_pipeline_result(self, job, target_language, source_language):
+        """
+        Reuse the outputs of an earlier run on identical input and languages.
+        The cached files are copied into the job's output folder under this run's names.
+        
+        Returns:
+            Pipeline result dictionary, or None on a cache miss
+        """
+        cache_dir = self._result_cache_dir(job, target_language, source_language)
+        if not cache_dir or not os.path.isdir(cache_dir):
+            return None
+        
+        base_output = os.path.join(job['output_folder'], job['base_name'])
+        file_ext = job['file_ext']
+        result = {
+            'ocr_text': f"{base_output}_searchable_ocr_text.txt",
+            'searchable_document': f"{base_output}_searchable{file_ext}",
+            'translated_document': f"{base_output}_translated_{target_language}{file_ext}"
+        }
+        try:
+            with open(os.path.join(cache_dir, "result.json"), encoding="utf-8") as f:
+                result['detected_source_language'] = json.load(f)['detected_source_language']
+            for name in ('ocr_text', 'searchable_document', 'translated_document'):
+                _copy_file(os.path.join(cache_dir, name), result[name])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Pipeline result cache read note: %s", e)
+            return None
+        
+        logger.info("✓ Pipeline result loaded from cache: %s", cache_dir)
+        return result
+    
+    def _store_pipeline_result(self, job, result, target_language, source_language):
+        """Copy a successful run's outputs into the result cache."""
+        cache_dir = self._result_cache_dir(job, target_language, source_language)
+        if not cache_dir or not result or os.path.isdir(cache_dir):
+            return
+        
+        # Build the entry under a temporary name and rename it into place, so
+        # concurrent runs never see a partially written entry
+        tmp_dir = f"{cache_dir}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(tmp_dir)
+            for name in ('ocr_text', 'searchable_document', 'translated_document'):
+                _copy_file(result[name], os.path.join(tmp_dir, name))
+            with open(os.path.join(tmp_dir, "result.json"), "w", encoding="utf-8") as f:
+                json.dump({'detected_source_language': result['detected_source_language']}, f)
+            os.rename(tmp_dir, cache_dir)
+        except OSError as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            logger.warning("Pipeline result cache write note: %s", e)
+    
+    def process_document(self, input_file_path, target_language, output_folder="output", source_language=None, force_ocr=False):
         """
         Complete pipeline: OCR → Extract Text → Translate Document
         Supports all 25+ file formats (PDF, Office, Images, etc.)
+        PDFs that already contain a text layer skip OCR unless force_ocr is set.
         
         Args:
-            input_file_path: Path to the input document (any supported format)
+            input_file_path: Path to the input document (any supported format), or the URL of
+                             a blob holding it (with SAS token unless using Managed Identity)
             target_language: Target language code (e.g., 'es', 'fr', 'de')
             output_folder: Folder to save output files
             source_language: Optional source language code (if not provided, auto-detect)
+            force_ocr: If True, run OCR even on PDFs that already have a text layer
             
         Returns:
             Dictionary with paths to OCR text and translated files
         """
         try:
-            os.makedirs(output_folder, exist_ok=True)
-            
-            # Get file extension and base name
-            file_ext = os.path.splitext(input_file_path)[1]
-            base_name = os.path.splitext(os.path.basename(input_file_path))[0]
-            
-            print("="*70)
-            print("STARTING OCR + TRANSLATION PIPELINE")
-            print("="*70)
-            print(f"Input: {input_file_path}")
-            print(f"Format: {file_ext}")
-            print(f"Target language: {target_language}")
-            print()
-            
-            # Step 1: OCR Analysis
-            print("STEP 1: OCR Analysis")
-            print("-" * 70)
-            ocr_result = self.analyze_document_with_ocr(input_file_path)
-            
-            # Step 2: Create Searchable Document with OCR text
-            print("\nSTEP 2: Extracting OCR Text")
-            print("-" * 70)
-            searchable_doc_path = os.path.join(output_folder, f"{base_name}_searchable{file_ext}")
-            self.create_searchable_document(input_file_path, ocr_result, searchable_doc_path)
+            job = self._start_pipeline(input_file_path, target_language, output_folder, force_ocr)
+            
+            cached = None if force_ocr else self._load_cached_pipeline_result(job, target_language, source_language)
+            if cached:
+                return cached
+            
+            ocr_result = None
+            if job['needs_ocr']:
+                # Step 1: OCR Analysis
+                logger.info("STEP 1: OCR Analysis")
+                ocr_result = self.analyze_document_with_ocr(
+                    job['input_file_path'], content_hash=job['content_hash'], document=job['document_bytes'],
+                    document_url=job['source_url']
+                )
+            self._build_searchable_document(job, ocr_result)
             
             # Step 3: Translate
-            print("\nSTEP 3: Translation")
-            print("-" * 70)
+            logger.info("STEP 3: Translation")
             translation_result = self.translate_document(
-                searchable_doc_path,
+                job['searchable_doc_path'],
                 target_language,
-                source_language=source_language
+                source_language=source_language,
+                content_hash=job['upload_hash'],
+                data=job['upload_data'],
+                source_url=job['source_url']
             )
             
-            # Step 4: Download translated document
-            if translation_result:
-                print("\nSTEP 4: Downloading Translated Document")
-                print("-" * 70)
-                
-                # Handle both old string format and new dict format
-                if isinstance(translation_result, dict):
-                    translated_url = translation_result['url']
-                    detected_lang = translation_result.get('detected_source_language', 'unknown')
-                else:
-                    translated_url = translation_result
-                    detected_lang = 'unknown'
-                
-                translated_doc_path = os.path.join(
-                    output_folder,
-                    f"{base_name}_translated_{target_language}{file_ext}"
+            result = self._finish_pipeline(job, translation_result, target_language)
+            self._store_pipeline_result(job, result, target_language, source_language)
+            return result
+            
+        except Exception as e:
+            logger.error("✗ Pipeline failed: %s", e)
+            raise
+    
+    async def process_document_async(self, input_file_path, target_language, output_folder="output", source_language=None, force_ocr=False):
+        """
+        Async version of process_document.
+        
+        The OCR and translation jobs are awaited on the async SDK clients while
+        local file and blob work runs in worker threads, so several documents can
+        be processed concurrently (see process_documents_async).
+        
+        When the searchable document is a plain copy of the input, its upload and
+        the translation container setup run while OCR is still in progress.
+        """
+        prepare_task = None
+        try:
+            job = await _run_blocking(self._start_pipeline, input_file_path, target_language, output_folder, force_ocr)
+            
+            if not force_ocr:
+                cached = await _run_blocking(self._load_cached_pipeline_result, job, target_language, source_language)
+                if cached:
+                    return cached
+            
+            if job['upload_is_input']:
+                # The bytes to translate are already known, so overlap the upload with OCR
+                prepare_task = asyncio.create_task(_run_blocking(
+                    self._prepare_translation,
+                    job['searchable_doc_path'], target_language, "ocr-source", "ocr-target",
+                    source_language=source_language, content_hash=job['upload_hash'], data=job['upload_data'],
+                    source_url=job['source_url']
+                ))
+            
+            ocr_result = None
+            if job['needs_ocr']:
+                # Step 1: OCR Analysis
+                logger.info("STEP 1: OCR Analysis")
+                ocr_result = await self.analyze_document_with_ocr_async(
+                    job['input_file_path'], content_hash=job['content_hash'], document=job['document_bytes'],
+                    document_url=job['source_url']
                 )
-                self.download_from_blob(translated_url, translated_doc_path)
-                
-                # Get OCR text file path
-                ocr_text_path = os.path.join(output_folder, f"{base_name}_searchable_ocr_text.txt")
-                
-                print("\n" + "="*70)
-                print("PIPELINE COMPLETED SUCCESSFULLY!")
-                print("="*70)
-                print(f"✓ OCR text: {ocr_text_path}")
-                print(f"✓ Searchable document: {searchable_doc_path}")
-                print(f"✓ Translated document: {translated_doc_path}")
-                print(f"📝 Detected source language: {detected_lang}")
-                print(f"🎯 Target language: {target_language}")
-                
-                # Log completion with detected language
-                logger.info(f"OCR Pipeline completed - Format: {file_ext} | Source: {detected_lang} → Target: {target_language}")
-                
-                return {
-                    'ocr_text': ocr_text_path,
-                    'searchable_document': searchable_doc_path,
-                    'translated_document': translated_doc_path,
-                    'detected_source_language': detected_lang
-                }
-            else:
-                print("\n✗ Translation failed")
-                return None
+            await _run_blocking(self._build_searchable_document, job, ocr_result)
+            
+            # Step 3: Translate
+            logger.info("STEP 3: Translation")
+            translation_result = await self.translate_document_async(
+                job['searchable_doc_path'],
+                target_language,
+                source_language=source_language,
+                content_hash=job['upload_hash'],
+                data=job['upload_data'],
+                source_url=job['source_url'],
+                translation_input=await prepare_task if prepare_task else None
+            )
+            
+            result = await _run_blocking(self._finish_pipeline, job, translation_result, target_language)
+            await _run_blocking(self._store_pipeline_result, job, result, target_language, source_language)
+            return result
             
         except Exception as e:
-            print(f"\n✗ Pipeline failed: {e}")
+            if prepare_task and not prepare_task.done():
+                prepare_task.cancel()
+            logger.error("✗ Pipeline failed: %s", e)
             raise
+    
+    async def process_documents_async(self, input_files, target_language, output_folder="output", source_language=None, force_ocr=False):
+        """
+        Run the pipeline for several documents concurrently.
+        
+        Concurrency against each service is bounded by the OCR and translation
+        semaphores, so wall-clock time approaches the slowest document rather than
+        the sum of all of them.
+        
+        Args:
+            input_files: Paths (or blob URLs) of the input documents (file names must be distinct)
+            target_language: Target language code (e.g., 'es', 'fr', 'de')
+            output_folder: Folder to save output files
+            source_language: Optional source language code (if not provided, auto-detect)
+            force_ocr: If True, run OCR even on PDFs that already have a text layer
+            
+        Returns:
+            List of per-document results (or the exception raised for that document), in input order
+        """
+        # The source blob and the output files are named after the input's base name, so
+        # two inputs sharing one (dir1/report.pdf, dir2/report.pdf) would overwrite each
+        # other; the same input twice is processed once
+        unique_files = list(dict.fromkeys(input_files))
+        base_names = [os.path.splitext(document_name(input_file))[0].lower() for input_file in unique_files]
+        if len(set(base_names)) != len(base_names):
+            raise ValueError("Input documents must have distinct file names")
+        
+        results = await asyncio.gather(
+            *(self.process_document_async(
+                input_file, target_language,
+                output_folder=output_folder,
+                source_language=source_language,
+                force_ocr=force_ocr
+            ) for input_file in unique_files),
+            return_exceptions=True
+        )
+        results_by_file = dict(zip(unique_files, results))
+        return [results_by_file[input_file] for input_file in input_files]
 
 
 def main():
@@ -516,32 +1536,39 @@ def main():
     pipeline = OCRTranslationPipeline()
     
     # Configuration - supports all file formats!
-    input_file = "sample.pdf"  # Change to your file (PDF, DOCX, JPG, PNG, etc.)
+    input_files = ["sample.pdf"]  # Change to your files (PDF, DOCX, JPG, PNG, etc.)
     target_language = "es"  # Spanish - change to your target language
     output_folder = "ocr_translated_output"
     
     # Examples of supported formats:
-    # input_file = "document.docx"  # Word document
-    # input_file = "scan.jpg"       # Image file
-    # input_file = "presentation.pptx"  # PowerPoint
-    # input_file = "spreadsheet.xlsx"   # Excel
-    
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"Error: Input file '{input_file}' not found!")
-        print("Please update the 'input_file' variable with your document file path.")
-        print("Supported formats: PDF, Office (Word/Excel/PowerPoint), Images, and 25+ more!")
+    # input_files = ["document.docx",      # Word document
+    #                "scan.jpg",           # Image file
+    #                "presentation.pptx",  # PowerPoint
+    #                "spreadsheet.xlsx"]   # Excel
+    
+    # Check that the input files exist
+    missing = [f for f in input_files if not is_blob_url(f) and not os.path.exists(f)]
+    if missing:
+        logger.error("Input file(s) not found: %s", ', '.join(missing))
+        logger.error("Please update the 'input_files' variable with your document file paths.")
+        logger.error("Supported formats: PDF, Office (Word/Excel/PowerPoint), Images, and 25+ more!")
         return
     
-    # Process the document
-    results = pipeline.process_document(
-        input_file_path=input_file,
-        target_language=target_language,
-        output_folder=output_folder
-    )
+    # Process the documents concurrently
+    async def run():
+        try:
+            return await pipeline.process_documents_async(input_files, target_language, output_folder=output_folder)
+        finally:
+            await pipeline.aclose()
+    
+    results = asyncio.run(run())
+    
+    for input_file, result in zip(input_files, results):
+        if isinstance(result, Exception):
+            logger.error("✗ %s: %s", input_file, result)
     
-    if results:
-        print(f"\n✓ All files saved in: {output_folder}")
+    if any(result and not isinstance(result, Exception) for result in results):
+        logger.info("✓ All files saved in: %s", output_folder)
 
 
 if __name__ == "__main__":
@@ -6,14 +6,34 @@ Supports: PDF, Office (Word/Excel/PowerPoint), OpenDocument, Text, HTML, Markdow
 
 import os
 import time
+import uuid
+import queue
+import atexit
+import asyncio
+import hashlib
+import functools
 import logging
-from azure.ai.translation.document import DocumentTranslationClient, DocumentTranslationInput, TranslationTarget
+import logging.handlers
+import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+from azure.ai.translation.document import DocumentTranslationClient, DocumentTranslationInput, TranslationTarget, SingleDocumentTranslationClient
+from azure.ai.translation.document.models import DocumentTranslateContent
+from azure.ai.translation.document.aio import DocumentTranslationClient as AsyncDocumentTranslationClient
 from azure.core.credentials import AzureKeyCredential
-from azure.storage.blob import BlobServiceClient, generate_blob_sas, generate_container_sas, BlobSasPermissions, ContainerSasPermissions
+from azure.core.exceptions import HttpResponseError, ResourceExistsError, ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.storage.blob import BlobServiceClient, ContentSettings, generate_container_sas, ContainerSasPermissions
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
 from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
-from datetime import datetime, timedelta
+from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
+from blob_utils import blob_url_in_container, build_requests_transport, copy_blob_and_wait, document_name, is_blob_url, open_for_upload, parse_blob_url
+
 # Load environment variables
 load_dotenv()
 
@@ -21,15 +41,21 @@ load_dotenv()
 log_level_str = os.getenv('LOG_LEVEL', 'INFO').upper()
 log_level = getattr(logging, log_level_str, logging.INFO)
 
-# Configure logging with Azure SDK HTTP logging
+# Configure logging with Azure SDK HTTP logging. Records are queued and written to the
+# file and console by a background listener thread, so logging on the translate path
+# never waits on disk I/O (DEBUG HTTP traces can be many MB per translation)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+_log_handlers = [logging.FileHandler('translation_app.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=log_level,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.FileHandler('translation_app.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Timestamp and level are added by the listener's handlers
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -39,20 +65,192 @@ azure_logger.setLevel(log_level)
 if log_level == logging.DEBUG:
     logger.info("API call logging enabled - HTTP requests, headers, and responses will be logged")
 else:
-    logger.info(f"Logging level: {log_level_str}")
+    logger.info("Logging level: %s", log_level_str)
+
+# Blob transfer tuning: uploads above MAX_SINGLE_PUT_SIZE are split into blocks that are
+# sent in parallel, and the transport reads responses in CONNECTION_DATA_BLOCK_SIZE pieces.
+# Block size (in MiB) and the per-transfer connection cap can be tuned with
+# AZURE_UPLOAD_CHUNK_SIZE and AZURE_UPLOAD_CONCURRENCY
+MAX_SINGLE_PUT_SIZE = 4 * 1024 * 1024
+DEFAULT_MAX_BLOCK_SIZE = int(os.getenv("AZURE_UPLOAD_CHUNK_SIZE", "8")) * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("AZURE_UPLOAD_CONCURRENCY", "16"))
+CONNECTION_DATA_BLOCK_SIZE = 4 * 1024 * 1024
+# Downloads are fetched as parallel ranged GETs of this size
+MAX_CHUNK_GET_SIZE = 16 * 1024 * 1024
+# Parallel block uploads per document, by file size: (size limit, concurrency). Small files
+# fit in a few blocks where extra connections only add overhead; big ones benefit from more
+UPLOAD_CONCURRENCY_BY_SIZE = [
+    (4 * 1024 * 1024, 1),
+    (64 * 1024 * 1024, 4),
+    (512 * 1024 * 1024, 8),
+    (4 * 1024 * 1024 * 1024, 16),
+]
+MAX_UPLOAD_CONCURRENCY = 32
+# Transient failures (408, 429, 5xx, dropped connections) are retried by the SDK pipelines
+# with bounded exponential backoff. Storage adds random jitter to every delay (1, 3, 5, 9, 17s +/- 1s),
+# and Translator waits for the Retry-After header when the service sends one
+BLOB_RETRY_OPTIONS = {
+    'retry_total': 5,
+    'initial_backoff': 1,
+    'increment_base': 2,
+    'random_jitter_range': 1
+}
+TRANSLATION_RETRY_OPTIONS = {
+    'retry_total': 5,
+    'retry_backoff_factor': 1.0,
+    'retry_backoff_max': 30
+}
+# SAS tokens are signed for SAS_LIFETIME and re-signed once less than SAS_REFRESH_MARGIN remains
+SAS_LIFETIME = timedelta(hours=24)
+SAS_REFRESH_MARGIN = timedelta(hours=2)
+# User delegation keys (Managed Identity SAS signing) are requested for the 7-day maximum
+# and replaced once a SAS signed with them could outlive the key
+USER_DELEGATION_KEY_LIFETIME = timedelta(days=7)
+# Content digests of local input files kept in memory, keyed by file version
+FILE_MD5_CACHE_SIZE = 256
+# Number of documents uploaded to blob storage in parallel by translate_documents
+UPLOAD_PARALLEL = int(os.getenv("UPLOAD_PARALLEL", "16"))
+# Worker threads for those uploads, shared by every translator in the process so
+# creating a translator per request does not leave a new idle pool behind each time
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=UPLOAD_PARALLEL + 1, thread_name_prefix="translator-upload")
+# Local documents up to this size, in these formats, are sent to the synchronous translation
+# endpoint by translate_document_to_file: one request, no blob storage round trips
+DIRECT_TRANSLATION_MAX_SIZE = 10 * 1024 * 1024
+DIRECT_TRANSLATION_EXTENSIONS = {
+    '.txt', '.tsv', '.tab', '.csv', '.html', '.htm', '.mhtml', '.mht',
+    '.docx', '.xlsx', '.pptx', '.msg', '.xlf', '.xliff', '.md', '.markdown', '.mdown', '.mkdn'
+}
+# Connections kept per host by the sync clients; parallel document uploads each run
+# their own block uploads, so the requests default of 10 would make them queue
+CONNECTION_POOL_SIZE = 64
+
+
+class _KeepAliveAioHttpTransport(AioHttpTransport):
+    """
+    aiohttp transport with a larger keep-alive connection pool for the async clients.
+    
+    Status polls and block uploads reuse pooled TLS connections instead of
+    reconnecting once aiohttp's default 15-second keep-alive lapses. The connector
+    needs a running event loop, so the session is created when the transport opens.
+    """
+    
+    def __init__(self, pool_size=100, keepalive_timeout=60, **kwargs):
+        kwargs.setdefault("connection_timeout", 30)
+        super().__init__(**kwargs)
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+    
+    async def open(self):
+        # A closed transport keeps _has_been_opened set; leave it to the base class to reject reuse
+        if not self.session and self._session_owner and not self._has_been_opened:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size, keepalive_timeout=self._keepalive_timeout),
+                trust_env=self._use_env_settings,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False
+            )
+        await super().open()
+
+
+def _document_stat(path_or_url):
+    """Return os.stat() of a local input document, or None for a blob URL."""
+    if is_blob_url(path_or_url):
+        return None
+    return os.stat(path_or_url)
+
+
+def _document_size(path_or_url):
+    """Return the size in bytes of a local input document, or None for a blob URL."""
+    st = _document_stat(path_or_url)
+    return st.st_size if st else None
+
+
+def _file_md5(file_path, st):
+    """
+    Return the MD5 digest of a local file's contents.
+    
+    Digests are cached per file version (path, size, mtime, inode), so translating an
+    unchanged file again, e.g. into another language, does not read it a second time.
+    """
+    return _cached_file_md5(os.path.abspath(file_path), st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+@functools.lru_cache(maxsize=FILE_MD5_CACHE_SIZE)
+def _cached_file_md5(file_path, size, mtime_ns, inode):
+    """Compute the MD5 digest of a file, reading it in 1 MiB blocks."""
+    md5 = hashlib.md5()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            md5.update(block)
+    return md5.digest()
+
+
+def _blob_has_content(props, content_md5, file_size):
+    """Check whether existing blob properties match a local file's MD5 and size."""
+    stored_md5 = props.content_settings.content_md5 if props else None
+    return bool(stored_md5) and bytes(stored_md5) == content_md5 and props.size == file_size
+
+
+def _source_blob_name(path_or_url, content_md5=None):
+    """
+    Return the source blob name for an input document.
+    
+    Local files are named after their content (MD5 and extension), so the same bytes map
+    to the same blob whatever path or name they are uploaded from; blob URL inputs get
+    a random prefix.
+    """
+    if content_md5:
+        return f"{content_md5.hex()}{os.path.splitext(document_name(path_or_url))[1].lower()}"
+    return f"{uuid.uuid4().hex[:12]}-{document_name(path_or_url)}"
+
+
+def _preallocate(f, size):
+    """Reserve size bytes on disk for a download, where the platform supports it."""
+    if size and hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(f.fileno(), 0, size)
 
 
 class SingleDocumentTranslator:
-    def __init__(self, use_managed_identity=None):
+    def __init__(self, use_managed_identity=None, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 max_block_size=DEFAULT_MAX_BLOCK_SIZE, initial_polling_interval=None, warm_connections=True,
+                 user_delegation_sas=None):
         """
         Initialize the translator with Azure credentials.
         
         Args:
             use_managed_identity: If True, use Managed Identity. If False, use keys.
                                  If None (default), auto-detect based on available credentials.
+            max_concurrency: Upper bound on the parallel connections used for each blob transfer
+            max_block_size: Size in bytes of each block when a large document is uploaded in chunks
+            initial_polling_interval: Seconds between translation job status polls
+                                      (defaults to TRANSLATION_POLLING_INTERVAL, or the SDK's 1)
+            warm_connections: If True, open connections to storage and Translator in a background thread
+            user_delegation_sas: With Managed Identity, pass the Translator SAS URLs signed with a cached
+                                 user delegation key instead of bare URLs, so its own managed identity
+                                 needs no storage role (defaults to AZURE_STORAGE_USER_DELEGATION_SAS, or False)
         """
         logger.info("Initializing SingleDocumentTranslator")
         
+        self.max_concurrency = max_concurrency
+        self.max_block_size = max_block_size
+        if initial_polling_interval is None:
+            initial_polling_interval = float(os.getenv("TRANSLATION_POLLING_INTERVAL", "1"))
+        self.initial_polling_interval = initial_polling_interval
+        # Containers known to exist and SAS tokens already signed, reused across calls
+        self._container_ready = set()
+        self._sas_cache = {}
+        self._sas_expiry_cached = None
+        self._sas_expiry_stamp_ts = 0.0
+        self._user_delegation_key = None
+        self._user_delegation_key_refresh_at = 0.0
+        blob_client_options = {
+            'max_single_put_size': MAX_SINGLE_PUT_SIZE,
+            'max_block_size': max_block_size,
+            'max_chunk_get_size': MAX_CHUNK_GET_SIZE,
+            'connection_data_block_size': CONNECTION_DATA_BLOCK_SIZE,
+            **BLOB_RETRY_OPTIONS
+        }
+        
         self.translator_endpoint = os.getenv("AZURE_TRANSLATOR_ENDPOINT")
         self.translator_key = os.getenv("AZURE_TRANSLATOR_KEY")
         self.storage_account_name = os.getenv("AZURE_STORAGE_ACCOUNT_NAME")
@@ -64,12 +262,18 @@ class SingleDocumentTranslator:
             logger.error("Missing required credentials")
             raise ValueError("Missing required AZURE_TRANSLATOR_ENDPOINT or AZURE_STORAGE_ACCOUNT_NAME")
         
+        self._blob_account_url = f"https://{self.storage_account_name}.blob.core.windows.net"
+        
         # Auto-detect authentication method
         if use_managed_identity is None:
             # Use Managed Identity if connection string is not provided
             use_managed_identity = not bool(self.storage_connection_string)
         
         self.use_managed_identity = use_managed_identity
+        if user_delegation_sas is None:
+            user_delegation_sas = os.getenv("AZURE_STORAGE_USER_DELEGATION_SAS", "false").lower() == "true"
+        # User delegation keys are issued to Azure AD identities only, not to account keys
+        self.user_delegation_sas = bool(user_delegation_sas) and use_managed_identity
         
         # Initialize translation client
         if use_managed_identity:
@@ -78,11 +282,35 @@ class SingleDocumentTranslator:
             credential = DefaultAzureCredential()
             self.translation_client = DocumentTranslationClient(
                 self.translator_endpoint,
-                credential
+                credential,
+                transport=build_requests_transport(CONNECTION_POOL_SIZE),
+                **TRANSLATION_RETRY_OPTIONS
+            )
+            self.single_translation_client = SingleDocumentTranslationClient(
+                self.translator_endpoint,
+                credential,
+                **TRANSLATION_RETRY_OPTIONS
             )
             self.blob_service_client = BlobServiceClient(
-                account_url=f"https://{self.storage_account_name}.blob.core.windows.net",
-                credential=credential
+                account_url=self._blob_account_url,
+                credential=credential,
+                transport=build_requests_transport(CONNECTION_POOL_SIZE),
+                **blob_client_options
+            )
+            
+            # Async clients (used by the *_async methods) need an async credential
+            self._aio_credential = AsyncDefaultAzureCredential()
+            self.aio_translation_client = AsyncDocumentTranslationClient(
+                self.translator_endpoint,
+                self._aio_credential,
+                transport=_KeepAliveAioHttpTransport(),
+                **TRANSLATION_RETRY_OPTIONS
+            )
+            self.aio_blob_service_client = AsyncBlobServiceClient(
+                account_url=self._blob_account_url,
+                credential=self._aio_credential,
+                transport=_KeepAliveAioHttpTransport(),
+                **blob_client_options
             )
         else:
             logger.info("Using Key-based authentication")
@@ -93,86 +321,500 @@ class SingleDocumentTranslator:
             
             self.translation_client = DocumentTranslationClient(
                 self.translator_endpoint,
-                AzureKeyCredential(self.translator_key)
+                AzureKeyCredential(self.translator_key),
+                transport=build_requests_transport(CONNECTION_POOL_SIZE),
+                **TRANSLATION_RETRY_OPTIONS
+            )
+            self.single_translation_client = SingleDocumentTranslationClient(
+                self.translator_endpoint,
+                AzureKeyCredential(self.translator_key),
+                **TRANSLATION_RETRY_OPTIONS
             )
             self.blob_service_client = BlobServiceClient.from_connection_string(
-                self.storage_connection_string
+                self.storage_connection_string,
+                transport=build_requests_transport(CONNECTION_POOL_SIZE),
+                **blob_client_options
+            )
+            
+            # Async clients (used by the *_async methods)
+            self._aio_credential = None
+            self.aio_translation_client = AsyncDocumentTranslationClient(
+                self.translator_endpoint,
+                AzureKeyCredential(self.translator_key),
+                transport=_KeepAliveAioHttpTransport(),
+                **TRANSLATION_RETRY_OPTIONS
             )
+            self.aio_blob_service_client = AsyncBlobServiceClient.from_connection_string(
+                self.storage_connection_string,
+                transport=_KeepAliveAioHttpTransport(),
+                **blob_client_options
+            )
+        
+        if not use_managed_identity and self.storage_account_key:
+            # Sign the default container SAS tokens up front so translate calls reuse them
+            self._get_source_container_url("source")
+            self._get_target_container_url("target")
+        
+        if warm_connections:
+            # DNS lookup and TLS handshakes happen off the critical path of the first translation
+            threading.Thread(target=self._warm_pools, daemon=True).start()
         
         logger.info("SingleDocumentTranslator initialized successfully")
     
-    def upload_document_to_blob(self, file_path, container_name):
+    def _warm_pools(self):
+        """Issue cheap calls to each service so their connection pools are primed."""
+        warmups = [
+            ("blob storage", self.blob_service_client.get_account_information),
+            ("translator", self.translation_client.get_supported_document_formats),
+        ]
+        for name, warmup in warmups:
+            try:
+                warmup()
+            except Exception as e:
+                # Warm-up is best effort; real errors surface on the first real call
+                logger.debug("Connection warm-up for %s failed: %s", name, e)
+    
+    def _ensure_container(self, container_name):
         """
-        Upload a document to Azure Blob Storage.
+        Create a blob container if it does not exist yet.
+        
+        Containers already seen by this translator are skipped without a request.
         
         Args:
-            file_path: Path to the local document file
             container_name: Name of the blob container
             
         Returns:
-            URL of the uploaded blob with SAS token
+            True if the container was created, False if it already existed,
+            None if that could not be determined (the error is logged)
         """
-        logger.info(f"Starting upload: {file_path} to container {container_name}")
+        if container_name in self._container_ready:
+            return False
+        
+        container_client = self.blob_service_client.get_container_client(container_name)
+        created = False
         try:
-            # Create container if it doesn't exist
-            container_client = self.blob_service_client.get_container_client(container_name)
-            try:
+            if container_client.exists():
+                logger.debug("Container %s already exists", container_name)
+                print(f"Container {container_name} already exists")
+            else:
                 # Create container without public access (SAS tokens will provide access)
                 container_client.create_container()
-                logger.info(f"Created new container: {container_name}")
+                created = True
+                logger.info("Created new container: %s", container_name)
                 print(f"Created container: {container_name}")
-            except Exception as e:
-                # Container might already exist, which is fine
-                if "ContainerAlreadyExists" in str(e) or "already exists" in str(e).lower():
-                    logger.debug(f"Container {container_name} already exists")
-                    print(f"Container {container_name} already exists")
-                else:
-                    logger.warning(f"Container creation note: {e}")
-                    print(f"Container creation note: {e}")
+        except ResourceExistsError:
+            # Created concurrently by another upload, which is fine
+            logger.debug("Container %s already exists", container_name)
+        except Exception as e:
+            # e.g. a transient failure or a managed identity without container rights;
+            # carry on and let the actual blob operation report any real problem
+            logger.warning("Container creation note: %s", e)
+            print(f"Container creation note: {e}")
+            return None
+        
+        self._container_ready.add(container_name)
+        return created
+    
+    def _sas_expiry(self):
+        """
+        Return the expiry for newly signed SAS tokens.
+        
+        The timestamp is recomputed at most once an hour (tracked on the monotonic
+        clock), so tokens signed within the same hour share one expiry.
+        """
+        if self._sas_expiry_cached is None or time.monotonic() - self._sas_expiry_stamp_ts > 3600:
+            self._sas_expiry_cached = datetime.now(timezone.utc) + SAS_LIFETIME
+            self._sas_expiry_stamp_ts = time.monotonic()
+        return self._sas_expiry_cached
+    
+    def _get_user_delegation_key(self):
+        """
+        Return a user delegation key for signing SAS tokens with Managed Identity.
+        
+        The key is fetched once and reused until a token signed with it could
+        outlive it, so signing needs no round trip to storage most of the time.
+        """
+        if self._user_delegation_key is None or time.monotonic() >= self._user_delegation_key_refresh_at:
+            logger.info("Requesting user delegation key for SAS signing")
+            now = datetime.now(timezone.utc)
+            self._user_delegation_key = self.blob_service_client.get_user_delegation_key(
+                key_start_time=now,
+                key_expiry_time=now + USER_DELEGATION_KEY_LIFETIME
+            )
+            self._user_delegation_key_refresh_at = time.monotonic() + (USER_DELEGATION_KEY_LIFETIME - SAS_LIFETIME).total_seconds()
+        return self._user_delegation_key
+    
+    def _get_sas(self, container_name, permission):
+        """
+        Return a container SAS token, reusing a cached token until it is within
+        SAS_REFRESH_MARGIN of expiring.
+        
+        Tokens are only ever signed per container (they also authorize the blobs in it),
+        so the cache holds one entry per container and permission set in use.
+        
+        Args:
+            container_name: Name of the blob container
+            permission: ContainerSasPermissions
+            
+        Returns:
+            SAS token string
+        """
+        key = (container_name, str(permission))
+        cached = self._sas_cache.get(key)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        
+        expiry = self._sas_expiry()
+        if self.user_delegation_sas:
+            signing_key = {'user_delegation_key': self._get_user_delegation_key()}
+        else:
+            signing_key = {'account_key': self.storage_account_key}
+        token = generate_container_sas(
+            account_name=self.storage_account_name,
+            container_name=container_name,
+            permission=permission,
+            expiry=expiry,
+            **signing_key
+        )
+        # Re-sign once the token is within SAS_REFRESH_MARGIN of its expiry
+        refresh_at = self._sas_expiry_stamp_ts + (SAS_LIFETIME - SAS_REFRESH_MARGIN).total_seconds()
+        self._sas_cache[key] = (token, refresh_at)
+        return token
+    
+    def _blob_access_url(self, blob_client, container_name):
+        """Return the URL the Translator service should use to read an uploaded blob."""
+        if self.use_managed_identity and not self.user_delegation_sas:
+            # With Managed Identity, return the blob URL directly
+            # Azure Translator will use its own managed identity to access
+            # blob_client.url is rebuilt on every access, so read it once
+            blob_url = blob_client.url
+            logger.debug("Returning blob URL (Managed Identity): %s", blob_url)
+            return blob_url
+        
+        # Reuse the source container's read SAS (account key, or user delegation key with
+        # Managed Identity) rather than signing a token for every uploaded blob
+        sas_token = self._get_sas(container_name, ContainerSasPermissions(read=True, list=True))
+        
+        blob_url_with_sas = f"{blob_client.url}?{sas_token}"
+        logger.debug("Returning blob URL with SAS token")
+        return blob_url_with_sas
+    
+    def copy_blob_from_url(self, source_url, blob_client):
+        """
+        Copy a blob into the given destination server side, without downloading it.
+        
+        Args:
+            source_url: URL of the source blob (with SAS token if not publicly readable)
+            blob_client: BlobClient of the destination blob
+        """
+        source_parts = urlparse(source_url)
+        if (not self.use_managed_identity and "sig=" not in source_parts.query
+                and source_url.lower().startswith(f"{self._blob_account_url.lower()}/")):
+            # Private blob in our own account: authorize the copy source with a read SAS
+            source_container, _ = parse_blob_url(source_url)
+            source_sas = self._get_sas(source_container, ContainerSasPermissions(read=True, list=True))
+            source_url = f"{source_url.split('?')[0]}?{source_sas}"
+        
+        copy_blob_and_wait(blob_client, source_url)
+    
+    def upload_document_to_blob(self, file_path, container_name, blob_name=None, file_size=None, content_md5=None):
+        """
+        Upload a document to Azure Blob Storage.
+        
+        When file_path is already an Azure blob URL, the blob is copied server side
+        instead, so the bytes never pass through this machine.
+        
+        Args:
+            file_path: Path to the local document file, or URL of a blob
+            container_name: Name of the blob container
+            blob_name: Optional blob name (defaults to the file name)
+            file_size: Optional size of the local file, when the caller has already stat-ed it
+            content_md5: Optional MD5 digest of the file; when given, the upload is skipped if
+                         the blob already holds the same content, and the digest is stored on the blob
+            
+        Returns:
+            URL of the uploaded blob with SAS token
+        """
+        logger.info("Starting upload: %s to container %s", file_path.split('?')[0], container_name)
+        try:
+            # Create container if it doesn't exist
+            self._ensure_container(container_name)
+            
+            blob_name = blob_name or document_name(file_path)
+            blob_client = self.blob_service_client.get_blob_client(container=container_name, blob=blob_name)
+            
+            if is_blob_url(file_path):
+                logger.info("Copying blob: %s (server side)", blob_name)
+                self.copy_blob_from_url(file_path, blob_client)
+                logger.info("Successfully copied %s to %s", blob_name, container_name)
+                print(f"Copied {blob_name} to container {container_name}")
+                return self._blob_access_url(blob_client, container_name)
             
             # Upload the file
-            blob_name = os.path.basename(file_path)
-            blob_client = container_client.get_blob_client(blob_name)
+            if file_size is None:
+                file_size = os.stat(file_path).st_size
             
-            logger.info(f"Uploading blob: {blob_name}")
-            with open(file_path, "rb") as data:
-                blob_client.upload_blob(data, overwrite=True)
-                logger.info(f"Successfully uploaded {blob_name} to {container_name}")
+            if content_md5 is not None:
+                try:
+                    props = blob_client.get_blob_properties()
+                except ResourceNotFoundError:
+                    props = None
+                if _blob_has_content(props, content_md5, file_size):
+                    logger.info("Skipping upload: %s already in %s with the same content", blob_name, container_name)
+                    print(f"{blob_name} is unchanged in container {container_name}, skipping upload")
+                    return self._blob_access_url(blob_client, container_name)
+            
+            logger.info("Uploading blob: %s (%s bytes)", blob_name, file_size)
+            with open_for_upload(file_path, file_size) as data:
+                # Passing the length lets the SDK split large files into blocks uploaded in parallel.
+                # No client-side MD5 pass over the data: TLS already protects it in transit
+                blob_client.upload_blob(
+                    data,
+                    overwrite=True,
+                    length=file_size,
+                    max_concurrency=self._upload_concurrency(file_size),
+                    validate_content=False,
+                    content_settings=ContentSettings(content_md5=content_md5) if content_md5 else None
+                )
+                logger.info("Successfully uploaded %s to %s", blob_name, container_name)
                 print(f"Uploaded {blob_name} to container {container_name}")
             
             # Return URL based on authentication method
-            if self.use_managed_identity:
-                # With Managed Identity, return the blob URL directly
-                # Azure Translator will use its own managed identity to access
-                logger.debug(f"Returning blob URL (Managed Identity): {blob_client.url}")
-                return blob_client.url
-            else:
-                # Generate SAS token for key-based authentication
-                logger.debug("Generating SAS token for blob access")
-                sas_token = generate_blob_sas(
-                    account_name=self.storage_account_name,
-                    container_name=container_name,
-                    blob_name=blob_name,
-                    account_key=self.storage_account_key,
-                    permission=BlobSasPermissions(read=True, list=True),
-                    expiry=datetime.utcnow() + timedelta(hours=24)
+            return self._blob_access_url(blob_client, container_name)
+            
+        except Exception as e:
+            logger.error("Error uploading document: %s", e, exc_info=True)
+            print(f"Error uploading document: {e}")
+            raise
+    
+    async def upload_document_to_blob_async(self, file_path, container_name, blob_name=None, file_size=None, content_md5=None):
+        """
+        Upload a document to Azure Blob Storage using the async blob client.
+        
+        Args:
+            file_path: Path to the local document file
+            container_name: Name of the blob container
+            blob_name: Optional blob name (defaults to the file name)
+            file_size: Optional size of the local file, when the caller has already stat-ed it
+            content_md5: Optional MD5 digest of the file; when given, the upload is skipped if
+                         the blob already holds the same content, and the digest is stored on the blob
+            
+        Returns:
+            URL of the uploaded blob with SAS token
+        """
+        if is_blob_url(file_path):
+            # Server-side copy; only the status polling would be async
+            return await asyncio.to_thread(self.upload_document_to_blob, file_path, container_name, blob_name)
+        
+        logger.info("Starting upload: %s to container %s", file_path, container_name)
+        try:
+            await asyncio.to_thread(self._ensure_container, container_name)
+            
+            blob_name = blob_name or os.path.basename(file_path)
+            blob_client = self.aio_blob_service_client.get_blob_client(container=container_name, blob=blob_name)
+            
+            if file_size is None:
+                file_size = os.stat(file_path).st_size
+            
+            if content_md5 is not None:
+                try:
+                    props = await blob_client.get_blob_properties()
+                except ResourceNotFoundError:
+                    props = None
+                if _blob_has_content(props, content_md5, file_size):
+                    logger.info("Skipping upload: %s already in %s with the same content", blob_name, container_name)
+                    print(f"{blob_name} is unchanged in container {container_name}, skipping upload")
+                    return self._blob_access_url(blob_client, container_name)
+            
+            logger.info("Uploading blob: %s (%s bytes)", blob_name, file_size)
+            with open_for_upload(file_path, file_size) as data:
+                await blob_client.upload_blob(
+                    data,
+                    overwrite=True,
+                    length=file_size,
+                    max_concurrency=self._upload_concurrency(file_size),
+                    validate_content=False,
+                    content_settings=ContentSettings(content_md5=content_md5) if content_md5 else None
                 )
-                
-                blob_url_with_sas = f"{blob_client.url}?{sas_token}"
-                logger.debug("Returning blob URL with SAS token")
-                return blob_url_with_sas
+                logger.info("Successfully uploaded %s to %s", blob_name, container_name)
+                print(f"Uploaded {blob_name} to container {container_name}")
+            
+            return self._blob_access_url(blob_client, container_name)
             
         except Exception as e:
-            logger.error(f"Error uploading document: {e}", exc_info=True)
+            logger.error("Error uploading document: %s", e, exc_info=True)
             print(f"Error uploading document: {e}")
             raise
     
+    def _get_source_container_url(self, source_container):
+        """
+        Return the source container URL for the Translator service.
+        
+        Note: Azure Translator needs container-level access, not individual blob URLs
+        """
+        logger.info("Generating source container URL")
+        if self.use_managed_identity and not self.user_delegation_sas:
+            # With Managed Identity, use container URL directly
+            source_container_url = f"{self._blob_account_url}/{source_container}"
+            logger.debug("Source container URL (Managed Identity): %s", source_container_url)
+        else:
+            # Generate SAS token for source container using container-specific function
+            logger.debug("Generating SAS token for source container")
+            source_sas_token = self._get_sas(source_container, ContainerSasPermissions(read=True, list=True))
+            source_container_url = f"{self._blob_account_url}/{source_container}?{source_sas_token}"
+            logger.debug("Source container SAS token generated")
+        return source_container_url
+    
+    def _get_target_container_url(self, target_container):
+        """Return the target container URL for the Translator service."""
+        # Get target container URL based on authentication method
+        logger.info("Generating target container URL")
+        if self.use_managed_identity and not self.user_delegation_sas:
+            # With Managed Identity, use container URL directly
+            target_container_url = f"{self._blob_account_url}/{target_container}"
+            logger.debug("Target container URL (Managed Identity): %s", target_container_url)
+        else:
+            # Generate SAS token for target container using container-specific function.
+            # Translator only needs write and list on the target (read and list on the source)
+            logger.debug("Generating SAS token for target container")
+            target_sas_token = self._get_sas(target_container, ContainerSasPermissions(write=True, list=True))
+            
+            target_container_url = f"{self._blob_account_url}/{target_container}?{target_sas_token}"
+            logger.debug("Target container SAS token generated")
+        return target_container_url
+    
+    def _upload_concurrency(self, file_size):
+        """Pick the number of parallel block uploads for a file, capped at max_concurrency."""
+        for size_limit, concurrency in UPLOAD_CONCURRENCY_BY_SIZE:
+            if file_size < size_limit:
+                return min(concurrency, self.max_concurrency)
+        return min(MAX_UPLOAD_CONCURRENCY, self.max_concurrency)
+    
+    @staticmethod
+    def _new_job_prefix():
+        """Return a random blob name prefix that scopes a translation job to its own blobs."""
+        return f"{uuid.uuid4().hex[:12]}-"
+    
+    @staticmethod
+    def _check_languages(source_language, target_language):
+        """Raise ValueError if the source and target languages are the same."""
+        if source_language and source_language.lower() == target_language.lower():
+            error_msg = f"Source language ({source_language}) and target language ({target_language}) are the same - no translation needed"
+            logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            raise ValueError(error_msg)
+    
+    def _build_translation_input(self, source_url, target_url, target_language, source_language=None, prefix=None, storage_type=None):
+        """
+        Build the DocumentTranslationInput for a translation job.
+        
+        With container URLs, only blobs whose names start with prefix are translated,
+        so earlier uploads left in the source container are not picked up again.
+        With storage_type "File", source_url and target_url name single blobs.
+        """
+        logger.info("Configuring translation job")
+        print("Starting translation job...")
+        # Build translation input with optional source language
+        translation_kwargs = {
+            'source_url': source_url,
+            'targets': [
+                TranslationTarget(
+                    target_url=target_url,
+                    language=target_language
+                )
+            ],
+            'prefix': prefix,
+            'storage_type': storage_type
+        }
+        
+        # Add source language if specified (otherwise Azure will auto-detect)
+        if source_language:
+            self._check_languages(source_language, target_language)
+            translation_kwargs['source_language'] = source_language
+            logger.info("Using specified source language: %s", source_language)
+            print(f"Using specified source language: {source_language}")
+        else:
+            logger.info("Using auto-detection for source language")
+            print("Using auto-detection for source language")
+        
+        return DocumentTranslationInput(**translation_kwargs)
+    
+    def _build_document_translation_input(self, source_container_url, blob_name, target_container_url, target_language, source_language=None):
+        """
+        Build a translation job for one source blob whose output gets a name unique to the job.
+        
+        The source blob is named after the file's contents and shared by every job on
+        that file, so the output cannot reuse its name: concurrent jobs translating the
+        same upload (e.g. into two languages) would overwrite or clear each other's output.
+        """
+        target_blob_name = f"{self._new_job_prefix()}{blob_name}"
+        return self._build_translation_input(
+            blob_url_in_container(source_container_url, blob_name),
+            blob_url_in_container(target_container_url, target_blob_name),
+            target_language, source_language,
+            storage_type="File"
+        )
+    
+    def _handle_translation_result(self, documents, target_language, source_language=None):
+        """
+        Turn the per-document statuses of a finished job into the translate_document result.
+        
+        Returns:
+            Dictionary with URL of the translated document and detected source language,
+            or None if the translation failed
+        """
+        # Check results
+        logger.info("Processing translation results")
+        for document in documents:
+            if document.status == "Succeeded":
+                logger.info("Translation succeeded for document")
+                logger.debug("Source URL: %s", document.source_document_url)
+                logger.debug("Translated URL: %s", document.translated_document_url)
+                
+                print(f"Translation completed successfully!")
+                print(f"  Source document: {document.source_document_url}")
+                print(f"  Translated document: {document.translated_document_url}")
+                
+                # Note: Azure Document Translation API does not expose detected source language
+                # The API detects language internally but doesn't return it in the response
+                detected_lang = 'auto-detected'
+                
+                # Warning: If auto-detection was used, we can't verify if source == target
+                # Azure will still process the translation even if languages match
+                if not source_language:
+                    logger.warning("Source language was auto-detected - cannot verify if it matches target (%s)", target_language)
+                    print(f"\n  WARNING: Source language was auto-detected")
+                    print(f"  If the document is already in {target_language}, the translation may be unnecessary")
+                
+                logger.info("Translation successful - Source: %s -> Target: %s", detected_lang, target_language)
+                print(f"\n  Detected source language: {detected_lang}")
+                print(f"  Target language: {target_language}")
+                
+                # Return both URL and detected language
+                return {
+                    'url': document.translated_document_url,
+                    'detected_source_language': detected_lang
+                }
+            elif document.status == "Failed":
+                error_code = document.error.code if document.error else 'Unknown'
+                error_msg = document.error.message if document.error else 'Unknown'
+                logger.error("Translation failed - Target: %s | Code: %s, Message: %s", target_language, error_code, error_msg)
+                
+                print(f"Translation failed!")
+                print(f"  Target language: {target_language}")
+                print(f"  Error code: {error_code}")
+                print(f"  Error message: {error_msg}")
+                return None
+            else:
+                logger.warning("Unexpected document status: %s", document.status)
+                print(f"  Status: {document.status}")
+    
     def translate_document(self, input_file_path, target_language, source_container="source", target_container="target", source_language=None):
         """
         Translate a single document.
         
         Args:
-            input_file_path: Path to the input document file
+            input_file_path: Path to the input document file, or URL of a blob to copy server side
             target_language: Target language code (e.g., 'es', 'fr', 'de')
             source_container: Name of the source blob container
             target_container: Name of the target blob container
@@ -181,9 +823,9 @@ class SingleDocumentTranslator:
         Returns:
             Dictionary with URL of the translated document and detected source language
         """
-        logger.info(f"Starting translation: {input_file_path} -> {target_language}")
+        logger.info("Starting translation: %s -> %s", input_file_path, target_language)
         if source_language:
-            logger.info(f"Source language specified: {source_language}")
+            logger.info("Source language specified: %s", source_language)
         else:
             logger.info("Source language: auto-detect")
             
@@ -193,165 +835,327 @@ class SingleDocumentTranslator:
             # Upload source document
             logger.info("Uploading source document to blob storage")
             print("Uploading source document...")
-            self.upload_document_to_blob(input_file_path, source_container)
-            
-            # Generate source container URL with SAS token
-            # Note: Azure Translator needs container-level access, not individual blob URLs
-            logger.info("Generating source container URL")
-            if self.use_managed_identity:
-                # With Managed Identity, use container URL directly
-                source_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}"
-                logger.debug(f"Source container URL (Managed Identity): {source_container_url}")
-            else:
-                # Generate SAS token for source container using container-specific function
-                logger.debug("Generating SAS token for source container")
-                source_sas_token = generate_container_sas(
-                    account_name=self.storage_account_name,
-                    container_name=source_container,
-                    account_key=self.storage_account_key,
-                    permission=ContainerSasPermissions(read=True, list=True),
-                    expiry=datetime.utcnow() + timedelta(hours=24)
-                )
-                source_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{source_container}?{source_sas_token}"
-                logger.debug("Source container SAS token generated")
+            st = _document_stat(input_file_path)
+            file_size = st.st_size if st else None
+            # Local files are named after their content, so translating the same bytes
+            # again reuses the blob that is already uploaded
+            content_md5 = _file_md5(input_file_path, st) if st else None
+            blob_name = _source_blob_name(input_file_path, content_md5)
+            self.upload_document_to_blob(
+                input_file_path, source_container,
+                blob_name=blob_name,
+                file_size=file_size,
+                content_md5=content_md5
+            )
+            
+            source_container_url = self._get_source_container_url(source_container)
+            self._ensure_container(target_container)
+            target_container_url = self._get_target_container_url(target_container)
+            
+            # Translate exactly this document's blob into an output blob named for this job
+            translation_input = self._build_document_translation_input(
+                source_container_url, blob_name, target_container_url, target_language, source_language
+            )
+            
+            # Start translation
+            logger.info("Submitting translation job to Azure")
+            poller = self.translation_client.begin_translation(
+                [translation_input],
+                polling_interval=self.initial_polling_interval
+            )
+            
+            logger.info("Translation job submitted, waiting for completion")
+            print("Translation job submitted. Waiting for completion...")
+            result = poller.result()
+            logger.info("Translation job completed")
+            
+            return self._handle_translation_result(result, target_language, source_language)
+            
+        except Exception as e:
+            logger.error("Error during translation: %s", e, exc_info=True)
+            print(f"Error during translation: {e}")
+            raise
+    
+    @staticmethod
+    def _can_translate_directly(input_file_path, file_size):
+        """Check whether a document is small enough, and in a format supported, for the synchronous endpoint."""
+        return (
+            file_size is not None
+            and file_size <= DIRECT_TRANSLATION_MAX_SIZE
+            and os.path.splitext(input_file_path)[1].lower() in DIRECT_TRANSLATION_EXTENSIONS
+        )
+    
+    def translate_document_to_file(self, input_file_path, target_language, output_path, source_container="source", target_container="target", source_language=None):
+        """
+        Translate a single document and save the result to a local file.
+        
+        Small local documents in supported formats are translated with the synchronous
+        single-document endpoint: the file goes in the request body and the translation
+        comes back in the response, with no blob storage, SAS tokens or job polling.
+        Anything else (or a document the endpoint rejects) goes through translate_document
+        and download_translated_document.
+        
+        Args:
+            input_file_path: Path to the input document file, or URL of a blob to copy server side
+            target_language: Target language code (e.g., 'es', 'fr', 'de')
+            output_path: Local path to save the translated document
+            source_container: Name of the source blob container (batch path only)
+            target_container: Name of the target blob container (batch path only)
+            source_language: Optional source language code (if not provided, auto-detect)
             
-            # Get target container URL with SAS token
-            logger.info(f"Setting up target container: {target_container}")
-            target_container_client = self.blob_service_client.get_container_client(target_container)
+        Returns:
+            Dictionary with the output path and detected source language,
+            or None if the translation failed
+        """
+        file_size = _document_size(input_file_path)
+        if self._can_translate_directly(input_file_path, file_size):
+            self._check_languages(source_language, target_language)
+            logger.info("Translating %s -> %s with the synchronous endpoint", input_file_path, target_language)
+            print(f"Starting translation of {input_file_path} to {target_language}")
             try:
-                # Create container without public access (SAS tokens will provide access)
-                target_container_client.create_container()
-                logger.info(f"Created target container: {target_container}")
-                print(f"Created target container: {target_container}")
-            except Exception as e:
-                # Container might already exist, which is fine
-                if "ContainerAlreadyExists" in str(e) or "already exists" in str(e).lower():
-                    logger.debug(f"Target container {target_container} already exists")
-                    print(f"Target container {target_container} already exists")
-                    # Clear existing blobs to avoid TargetFileAlreadyExists error
-                    logger.info("Clearing existing files from target container")
-                    print("Clearing existing files from target container...")
-                    blobs = target_container_client.list_blobs()
-                    for blob in blobs:
-                        target_container_client.delete_blob(blob.name)
-                        logger.debug(f"Deleted blob: {blob.name}")
-                        print(f"  Deleted: {blob.name}")
-                else:
-                    logger.warning(f"Target container creation note: {e}")
-                    print(f"Target container creation note: {e}")
-            
-            # Get target container URL based on authentication method
-            logger.info("Generating target container URL")
-            if self.use_managed_identity:
-                # With Managed Identity, use container URL directly
-                target_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container}"
-                logger.debug(f"Target container URL (Managed Identity): {target_container_url}")
-            else:
-                # Generate SAS token for target container using container-specific function
-                logger.debug("Generating SAS token for target container")
-                target_sas_token = generate_container_sas(
-                    account_name=self.storage_account_name,
-                    container_name=target_container,
-                    account_key=self.storage_account_key,
-                    permission=ContainerSasPermissions(write=True, read=True, list=True, create=True, add=True),
-                    expiry=datetime.utcnow() + timedelta(hours=24)
-                )
-                
-                target_container_url = f"https://{self.storage_account_name}.blob.core.windows.net/{target_container}?{target_sas_token}"
-                logger.debug("Target container SAS token generated")
-            
-            # Set up translation
-            logger.info("Configuring translation job")
-            print("Starting translation job...")
-            # Build translation input with optional source language
-            translation_kwargs = {
-                'source_url': source_container_url,  # Now using container URL, not blob URL
-                'targets': [
-                    TranslationTarget(
-                        target_url=target_container_url,
-                        language=target_language
+                content_type = mimetypes.guess_type(input_file_path)[0] or "application/octet-stream"
+                with open(input_file_path, "rb") as document:
+                    translated = self.single_translation_client.translate(
+                        DocumentTranslateContent(document=(os.path.basename(input_file_path), document, content_type)),
+                        target_language=target_language,
+                        source_language=source_language
                     )
-                ]
-            }
-            
-            # Add source language if specified (otherwise Azure will auto-detect)
-            if source_language:
-                # Check if source and target languages are the same
-                if source_language.lower() == target_language.lower():
-                    error_msg = f"Source language ({source_language}) and target language ({target_language}) are the same - no translation needed"
-                    logger.error(error_msg)
-                    print(f"Error: {error_msg}")
-                    raise ValueError(error_msg)
+                    with open(output_path, "wb") as output_file:
+                        for chunk in translated:
+                            output_file.write(chunk)
                 
-                translation_kwargs['source_language'] = source_language
-                logger.info(f"Using specified source language: {source_language}")
-                print(f"Using specified source language: {source_language}")
-            else:
-                logger.info("Using auto-detection for source language")
-                print("Using auto-detection for source language")
+                logger.info("Translation successful - Target: %s", target_language)
+                print("Translation completed successfully!")
+                print(f"Downloaded translated document to: {output_path}")
+                return {
+                    'path': output_path,
+                    'detected_source_language': 'auto-detected'
+                }
+            except HttpResponseError as e:
+                logger.warning("Synchronous translation failed, falling back to batch translation: %s", e)
+                print("Synchronous translation not available for this document, using batch translation")
+        
+        translation_result = self.translate_document(
+            input_file_path, target_language,
+            source_container=source_container,
+            target_container=target_container,
+            source_language=source_language
+        )
+        if not translation_result:
+            return None
+        
+        self.download_translated_document(translation_result['url'], output_path)
+        return {
+            'path': output_path,
+            'detected_source_language': translation_result.get('detected_source_language', 'unknown')
+        }
+    
+    def translate_documents(self, input_file_paths, target_language, source_container="source", target_container="target", source_language=None):
+        """
+        Translate several documents with a single translation job.
+        
+        The files are hashed and uploaded in parallel and submitted as one job with an
+        input per document, so the service translates them concurrently behind a single
+        poller instead of one job per file. Source blobs are named after their content,
+        so documents already uploaded (e.g. for another target language) are not sent again.
+        
+        Args:
+            input_file_paths: Paths (or blob URLs) of the input documents
+            target_language: Target language code (e.g., 'es', 'fr', 'de')
+            source_container: Name of the source blob container
+            target_container: Name of the target blob container
+            source_language: Optional source language code (if not provided, auto-detect)
+            
+        Returns:
+            List of translate_document results (None for documents that failed), in input order
+        """
+        logger.info("Starting translation of %d documents -> %s", len(input_file_paths), target_language)
+        try:
+            print(f"Starting translation of {len(input_file_paths)} documents to {target_language}")
             
-            translation_input = DocumentTranslationInput(**translation_kwargs)
+            def upload(path):
+                st = _document_stat(path)
+                content_md5 = _file_md5(path, st) if st else None
+                blob_name = _source_blob_name(path, content_md5)
+                self.upload_document_to_blob(
+                    path, source_container,
+                    blob_name=blob_name,
+                    file_size=st.st_size if st else None,
+                    content_md5=content_md5
+                )
+                return blob_name
+            
+            # Upload every document (and create the target container) in parallel
+            logger.info("Uploading source documents to blob storage")
+            print("Uploading source documents...")
+            target_future = _UPLOAD_EXECUTOR.submit(self._ensure_container, target_container)
+            unique_paths = list(dict.fromkeys(input_file_paths))
+            blob_name_by_path = dict(zip(unique_paths, _UPLOAD_EXECUTOR.map(upload, unique_paths)))
+            blob_names = [blob_name_by_path[path] for path in input_file_paths]
+            target_future.result()
+            
+            source_container_url = self._get_source_container_url(source_container)
+            target_container_url = self._get_target_container_url(target_container)
+            # Inputs with the same content share a blob, so translate it once
+            translation_inputs = [
+                self._build_document_translation_input(
+                    source_container_url, blob_name, target_container_url, target_language, source_language
+                )
+                for blob_name in dict.fromkeys(blob_names)
+            ]
             
-            # Start translation
             logger.info("Submitting translation job to Azure")
-            poller = self.translation_client.begin_translation([translation_input])
+            poller = self.translation_client.begin_translation(
+                translation_inputs,
+                polling_interval=self.initial_polling_interval
+            )
             
             logger.info("Translation job submitted, waiting for completion")
             print("Translation job submitted. Waiting for completion...")
             result = poller.result()
             logger.info("Translation job completed")
             
-            # Check results
-            logger.info("Processing translation results")
+            # Map each translated document back to its input by source blob name
+            results_by_blob = {}
             for document in result:
-                if document.status == "Succeeded":
-                    logger.info(f"Translation succeeded for document")
-                    logger.debug(f"Source URL: {document.source_document_url}")
-                    logger.debug(f"Translated URL: {document.translated_document_url}")
-                    
-                    print(f"Translation completed successfully!")
-                    print(f"  Source document: {document.source_document_url}")
-                    print(f"  Translated document: {document.translated_document_url}")
-                    
-                    # Note: Azure Document Translation API does not expose detected source language
-                    # The API detects language internally but doesn't return it in the response
-                    detected_lang = 'auto-detected'
-                    
-                    # Warning: If auto-detection was used, we can't verify if source == target
-                    # Azure will still process the translation even if languages match
-                    if not source_language:
-                        logger.warning(f"Source language was auto-detected - cannot verify if it matches target ({target_language})")
-                        print(f"\n  WARNING: Source language was auto-detected")
-                        print(f"  If the document is already in {target_language}, the translation may be unnecessary")
-                    
-                    logger.info(f"Translation successful - Source: {detected_lang} -> Target: {target_language}")
-                    print(f"\n  Detected source language: {detected_lang}")
-                    print(f"  Target language: {target_language}")
-                    
-                    # Return both URL and detected language
-                    return {
-                        'url': document.translated_document_url,
-                        'detected_source_language': detected_lang
-                    }
-                elif document.status == "Failed":
-                    error_code = document.error.code if document.error else 'Unknown'
-                    error_msg = document.error.message if document.error else 'Unknown'
-                    logger.error(f"Translation failed - Target: {target_language} | Code: {error_code}, Message: {error_msg}")
-                    
-                    print(f"Translation failed!")
-                    print(f"  Target language: {target_language}")
-                    print(f"  Error code: {error_code}")
-                    print(f"  Error message: {error_msg}")
-                    return None
-                else:
-                    logger.warning(f"Unexpected document status: {document.status}")
-                    print(f"  Status: {document.status}")
+                _, blob_name = parse_blob_url(document.source_document_url)
+                results_by_blob[blob_name] = self._handle_translation_result([document], target_language, source_language)
+            
+            return [results_by_blob.get(blob_name) for blob_name in blob_names]
             
         except Exception as e:
-            logger.error(f"Error during translation: {e}", exc_info=True)
+            logger.error("Error during batch translation: %s", e, exc_info=True)
             print(f"Error during translation: {e}")
             raise
     
+    async def translate_document_async(self, input_file_path, target_language, source_container="source", target_container="target", source_language=None):
+        """
+        Translate a single document using the async clients.
+        
+        The target container is prepared while the source document uploads,
+        and the job is polled without blocking a thread.
+        
+        Args:
+            input_file_path: Path to the input document file, or URL of a blob to copy server side
+            target_language: Target language code (e.g., 'es', 'fr', 'de')
+            source_container: Name of the source blob container
+            target_container: Name of the target blob container
+            source_language: Optional source language code (if not provided, auto-detect)
+            
+        Returns:
+            Dictionary with URL of the translated document and detected source language
+        """
+        logger.info("Starting translation: %s -> %s", input_file_path, target_language)
+        try:
+            print(f"Starting translation of {input_file_path} to {target_language}")
+            
+            st = _document_stat(input_file_path)
+            file_size = st.st_size if st else None
+            content_md5 = await asyncio.to_thread(_file_md5, input_file_path, st) if st else None
+            blob_name = _source_blob_name(input_file_path, content_md5)
+            await asyncio.gather(
+                self.upload_document_to_blob_async(
+                    input_file_path, source_container,
+                    blob_name=blob_name,
+                    file_size=file_size,
+                    content_md5=content_md5
+                ),
+                asyncio.to_thread(self._ensure_container, target_container)
+            )
+            source_container_url = self._get_source_container_url(source_container)
+            target_container_url = self._get_target_container_url(target_container)
+            
+            translation_input = self._build_document_translation_input(
+                source_container_url, blob_name, target_container_url, target_language, source_language
+            )
+            
+            logger.info("Submitting translation job to Azure")
+            poller = await self.aio_translation_client.begin_translation(
+                [translation_input],
+                polling_interval=self.initial_polling_interval
+            )
+            
+            logger.info("Translation job submitted, waiting for completion")
+            print("Translation job submitted. Waiting for completion...")
+            result = await poller.result()
+            documents = [document async for document in result]
+            logger.info("Translation job completed")
+            
+            return self._handle_translation_result(documents, target_language, source_language)
+            
+        except Exception as e:
+            logger.error("Error during translation: %s", e, exc_info=True)
+            print(f"Error during translation: {e}")
+            raise
+    
+    async def translate_documents_async(self, input_file_paths, target_language, source_container="source", target_container="target", source_language=None, max_concurrency=None):
+        """
+        Translate several documents concurrently, at most max_concurrency at a time.
+        
+        Every document is its own translation job in the shared source and target
+        containers; each job is scoped to its own blob name prefix, so concurrent jobs
+        do not pick up or clear each other's files. A path listed more than once is
+        translated once. A failure in one document does not cancel the others.
+        
+        Args:
+            input_file_paths: Paths (or blob URLs) of the input documents
+            target_language: Target language code (e.g., 'es', 'fr', 'de')
+            source_container: Name of the source blob container
+            target_container: Name of the target blob container
+            source_language: Optional source language code (if not provided, auto-detect)
+            max_concurrency: Maximum number of documents in flight at once
+                             (defaults to TRANSLATION_MAX_CONCURRENCY, or 8)
+            
+        Returns:
+            List of translate_document results (or the exception raised for that document), in input order
+        """
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "8"))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def translate_one(input_file_path):
+            async with semaphore:
+                return await self.translate_document_async(
+                    input_file_path,
+                    target_language,
+                    source_container=source_container,
+                    target_container=target_container,
+                    source_language=source_language
+                )
+        
+        # The same file twice would be translated twice for the same result
+        unique_paths = list(dict.fromkeys(input_file_paths))
+        results = await asyncio.gather(
+            *(translate_one(path) for path in unique_paths),
+            return_exceptions=True
+        )
+        results_by_path = dict(zip(unique_paths, results))
+        return [results_by_path[path] for path in input_file_paths]
+    
+    def _translated_blob_client(self, blob_url):
+        """Return a BlobClient for a translated document URL."""
+        container_name, blob_name = parse_blob_url(blob_url)
+        return self.blob_service_client.get_blob_client(
+            container=container_name,
+            blob=blob_name
+        )
+    
+    def iter_translated_chunks(self, blob_url):
+        """
+        Stream a translated document from blob storage chunk by chunk.
+        
+        Lets callers pipe the translated bytes into the next stage (another upload,
+        an HTTP response) without writing an intermediate file.
+        
+        Args:
+            blob_url: URL of the translated blob
+            
+        Yields:
+            Chunks of the document as bytes, of up to MAX_CHUNK_GET_SIZE each
+        """
+        stream = self._translated_blob_client(blob_url).download_blob()
+        yield from stream.chunks()
+    
     def download_translated_document(self, blob_url, output_path):
         """
         Download the translated document from blob storage.
@@ -361,24 +1165,41 @@ class SingleDocumentTranslator:
             output_path: Local path to save the translated document
         """
         try:
-            # Extract container and blob name from URL
-            url_parts = blob_url.split('?')[0].split('/')
-            container_name = url_parts[-2]
-            blob_name = url_parts[-1]
-            
-            blob_client = self.blob_service_client.get_blob_client(
-                container=container_name,
-                blob=blob_name
-            )
+            blob_client = self._translated_blob_client(blob_url)
             
+            # Fetch ranges in parallel and write each one at its offset in the preallocated
+            # file, so memory use is bounded by the chunks in flight, not the document size
+            stream = blob_client.download_blob(max_concurrency=self.max_concurrency)
             with open(output_path, "wb") as download_file:
-                download_file.write(blob_client.download_blob().readall())
+                _preallocate(download_file, stream.size)
+                stream.readinto(download_file)
             
             print(f"Downloaded translated document to: {output_path}")
             
         except Exception as e:
             print(f"Error downloading document: {e}")
             raise
+    
+    async def download_translated_document_async(self, blob_url, output_path):
+        """
+        Download the translated document from blob storage without blocking the event loop.
+        
+        The whole download, including every file write, runs through the sync client
+        in a worker thread; the async client's readinto would write each chunk on the
+        event loop. Ranges are still fetched in parallel.
+        
+        Args:
+            blob_url: URL of the translated blob
+            output_path: Local path to save the translated document
+        """
+        await asyncio.to_thread(self.download_translated_document, blob_url, output_path)
+    
+    async def aclose(self):
+        """Close the async SDK clients."""
+        await self.aio_translation_client.close()
+        await self.aio_blob_service_client.close()
+        if self._aio_credential is not None:
+            await self._aio_credential.close()
 
 
 def main():
@@ -387,38 +1208,47 @@ def main():
     translator = SingleDocumentTranslator()
     
     # Configuration
-    input_pdf = "sample.pdf"  # Change this to your PDF file path
+    input_files = ["sample.pdf"]  # Change this to your document file paths (or blob URLs)
     target_language = "es"  # Spanish - change to your target language (en, fr, de, etc.)
-    output_pdf = f"translated_{target_language}_{os.path.basename(input_pdf)}"
+    max_concurrency = int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "8"))  # Documents translated in parallel
     
-    # Check if input file exists
-    if not os.path.exists(input_pdf):
-        print(f"Error: Input file '{input_pdf}' not found!")
-        print("Please update the 'input_pdf' variable with your PDF file path.")
+    # Check that the input files exist
+    missing = [f for f in input_files if not is_blob_url(f) and not os.path.exists(f)]
+    if missing:
+        print(f"Error: Input file(s) not found: {', '.join(missing)}")
+        print("Please update the 'input_files' variable with your document file paths.")
         return
     
-    # Translate the document
-    translation_result = translator.translate_document(
-        input_file_path=input_pdf,
-        target_language=target_language
-    )
-    
-    if translation_result:
-        # Handle dictionary return format
-        if isinstance(translation_result, dict):
-            translated_url = translation_result['url']
-            detected_lang = translation_result.get('detected_source_language', 'unknown')
-        else:
-            translated_url = translation_result
-            detected_lang = 'unknown'
+    # Translate the documents concurrently
+    async def run():
+        try:
+            return await translator.translate_documents_async(
+                input_files,
+                target_language,
+                max_concurrency=max_concurrency
+            )
+        finally:
+            await translator.aclose()
+    
+    results = asyncio.run(run())
+    
+    for input_file, translation_result in zip(input_files, results):
+        if isinstance(translation_result, Exception):
+            print(f"\nTranslation failed for {input_file}: {translation_result}")
+            continue
+        if not translation_result:
+            print(f"\nTranslation failed for {input_file}.")
+            continue
+        
+        translated_url = translation_result['url']
+        detected_lang = translation_result.get('detected_source_language', 'unknown')
+        output_file = f"translated_{target_language}_{document_name(input_file)}"
         
         # Download the translated document
-        translator.download_translated_document(translated_url, output_pdf)
-        print(f"\nTranslation complete! Output saved to: {output_pdf}")
+        translator.download_translated_document(translated_url, output_file)
+        print(f"\nTranslation complete! Output saved to: {output_file}")
         print(f"  Detected source language: {detected_lang}")
         print(f"  Target language: {target_language}")
-    else:
-        print("\nTranslation failed.")
 
 
 if __name__ == "__main__":